@@ -0,0 +1,86 @@
+"""
+Import-time budget check.
+
+Times `import probability_playground` and the import of each submodule in
+fresh interpreters, and exits with status 1 if a median is over budget.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 2 --submodule-budget-ms 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_TIMER = "import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+
+SUBMODULES = [
+    'basic_probability',
+    'probability_types',
+    'event_relationships',
+    'probability_rules',
+    'card_simulations',
+    'bayesian_updating',
+    'hidden_markov',
+    'live_updating',
+    'bayesian_network',
+    'card_estimators',
+    'adaptive_simulation',
+    'hand_evaluator',
+    'instrumentation',
+    'alias_sampling',
+    'deck_dp',
+    'bootstrap',
+    'checkpointing',
+    'streaming_estimators',
+]
+
+# Submodules allowed more than --submodule-budget-ms, with the reason
+SUBMODULE_BUDGETS_MS = {
+    'live_updating': 120.0,  # `import asyncio` alone takes ~50 ms
+}
+
+
+def time_import(statement, repeats):
+    """Run `statement` in `repeats` fresh interpreters; return seconds per run"""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    times = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, '-c', _TIMER.format(statement=statement)],
+            cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True)
+        times.append(float(output.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeats', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float, default=5.0,
+                        help="budget for `import probability_playground`")
+    parser.add_argument('--submodule-budget-ms', type=float, default=50.0,
+                        help="budget for importing any single submodule")
+    args = parser.parse_args(argv)
+    
+    checks = [('probability_playground', 'import probability_playground', args.budget_ms)]
+    for name in SUBMODULES:
+        checks.append((f'probability_playground.{name}',
+                       f'import probability_playground.{name}',
+                       SUBMODULE_BUDGETS_MS.get(name, args.submodule_budget_ms)))
+    
+    over_budget = []
+    for label, statement, budget_ms in checks:
+        median_ms = statistics.median(time_import(statement, args.repeats)) * 1000
+        status = 'ok' if median_ms <= budget_ms else 'OVER BUDGET'
+        print(f"{label:45s} {median_ms:8.2f} ms  (budget {budget_ms:g} ms)  {status}")
+        if median_ms > budget_ms:
+            over_budget.append(label)
+    
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
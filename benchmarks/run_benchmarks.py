@@ -0,0 +1,300 @@
+"""
+Benchmarks for the hot path of every module.
+
+Each workload runs a fixed-seed stream of operations at one or more scales
+(10^k operations). For every run we report throughput, percentiles of
+the batch-mean latency (the run is timed in ~100 batches and each batch's
+time is divided by its size, so these are not per-operation percentiles:
+p99 is close to the slowest batch's mean) and peak memory (from a
+second, tracemalloc-instrumented pass). Results can be saved as
+JSON and compared against a saved baseline.
+
+    python benchmarks/run_benchmarks.py                          # 10^3..10^5
+    python benchmarks/run_benchmarks.py --scales 3 4 5 6 7 8     # up to 10^8
+    python benchmarks/run_benchmarks.py --output base.json
+    python benchmarks/run_benchmarks.py --baseline base.json --threshold 0.15
+
+Exit status is 1 if any workload is slower than the baseline by more than
+the threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from probability_playground import basic_probability  # noqa: E402
+from probability_playground import bayesian_updating  # noqa: E402
+from probability_playground import card_simulations  # noqa: E402
+from probability_playground import event_relationships  # noqa: E402
+from probability_playground import probability_rules  # noqa: E402
+from probability_playground import probability_types  # noqa: E402
+
+# Inputs are generated once per workload and reused cyclically, so memory
+# does not grow with the scale
+_POOL_SIZE = 10000
+
+
+# ==================== WORKLOADS ====================
+# Each workload takes a seed and returns run(count), which performs
+# `count` operations.
+
+def basic_probability_workload(seed):
+    rng = random.Random(seed)
+    rows = [(rng.randint(-5, 60), rng.randint(0, 52)) for _ in range(_POOL_SIZE)]
+    calculate = basic_probability.calculate_basic_probability
+    
+    def run(count):
+        for i in range(count):
+            favorable, total = rows[i % _POOL_SIZE]
+            calculate(favorable, total)
+    return run
+
+
+def identify_probability_type_workload(seed):
+    rng = random.Random(seed)
+    phrases = ["Based on 1000 coin toss observations", "All cards equally likely to be drawn",
+               "I feel it might rain today", "A fair die is rolled", "The sky is blue",
+               "Survey data collected from 300 people", "My gut feeling says yes"]
+    descriptions = [rng.choice(phrases) for _ in range(_POOL_SIZE)]
+    identify = probability_types.ProbabilityCalculator().identify_probability_type
+    
+    def run(count):
+        for i in range(count):
+            identify(descriptions[i % _POOL_SIZE])
+    return run
+
+
+def _probability_triples(rng):
+    triples = []
+    for _ in range(_POOL_SIZE):
+        pA, pB = rng.random(), rng.random()
+        triples.append((pA, pB, rng.uniform(max(0.0, pA + pB - 1), min(pA, pB))))
+    return triples
+
+
+def addition_rule_workload(seed):
+    triples = _probability_triples(random.Random(seed))
+    addition_rule = probability_rules.addition_rule
+    
+    def run(count):
+        for i in range(count):
+            pA, pB, pAB = triples[i % _POOL_SIZE]
+            addition_rule(pA, pB, pAB)
+    return run
+
+
+def multiplication_rule_workload(seed):
+    triples = _probability_triples(random.Random(seed))
+    multiplication_rule = probability_rules.multiplication_rule
+    
+    def run(count):
+        for i in range(count):
+            pA, pB, pB_given_A = triples[i % _POOL_SIZE]
+            multiplication_rule(pA, pB, False, pB_given_A)
+    return run
+
+
+def complement_rule_workload(seed):
+    rng = random.Random(seed)
+    values = [rng.random() for _ in range(_POOL_SIZE)]
+    complement_rule = probability_rules.complement_rule
+    
+    def run(count):
+        for i in range(count):
+            complement_rule(values[i % _POOL_SIZE])
+    return run
+
+
+def are_mutually_exclusive_workload(seed):
+    rng = random.Random(seed)
+    deck = list(range(1, 53))
+    pairs = [(rng.sample(deck, 13), rng.sample(deck, 13)) for _ in range(1000)]
+    are_mutually_exclusive = event_relationships.are_mutually_exclusive
+    
+    def run(count):
+        for i in range(count):
+            eventA, eventB = pairs[i % 1000]
+            are_mutually_exclusive(eventA, eventB, deck)
+    return run
+
+
+def simulate_draws_workload(seed):
+    """One operation = one card drawn (with replacement) and counted"""
+    deck = card_simulations.create_deck()
+    random_gen = card_simulations.SimpleRandom(seed)
+    simulate_draws = card_simulations.simulate_draws
+    experimental_probability = card_simulations.experimental_probability
+    
+    def is_heart(card):
+        return card.endswith('H')
+    
+    def run(count):
+        done = 0
+        while done < count:
+            chunk = min(count - done, _POOL_SIZE)
+            draws = simulate_draws(deck, chunk, with_replacement=True, random_gen=random_gen)
+            experimental_probability(draws, is_heart)
+            done += chunk
+    return run
+
+
+def bayesian_update_workload(seed):
+    rng = random.Random(seed)
+    hypotheses = [f"H{i}" for i in range(10)]
+    evidence_names = [f"E{i}" for i in range(20)]
+    prior = {h: 1 / len(hypotheses) for h in hypotheses}
+    likelihood = {e: {h: rng.uniform(0.05, 0.95) for h in hypotheses} for e in evidence_names}
+    stream = [rng.choice(evidence_names) for _ in range(_POOL_SIZE)]
+    updater = bayesian_updating.BayesianUpdater(prior, likelihood)
+    
+    def run(count):
+        for i in range(count):
+            if i % 50 == 0:
+                updater.current_belief = prior.copy()  # keep values away from underflow
+            updater.update(stream[i % _POOL_SIZE])
+    return run
+
+
+WORKLOADS = {
+    'calculate_basic_probability': basic_probability_workload,
+    'identify_probability_type': identify_probability_type_workload,
+    'addition_rule': addition_rule_workload,
+    'multiplication_rule': multiplication_rule_workload,
+    'complement_rule': complement_rule_workload,
+    'are_mutually_exclusive': are_mutually_exclusive_workload,
+    'simulate_draws+experimental_probability': simulate_draws_workload,
+    'BayesianUpdater.update': bayesian_update_workload,
+}
+
+
+# ==================== HARNESS ====================
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def measure(workload, operations, seed, batches=100, memory=True):
+    """
+    Time `operations` operations in about `batches` equal batches
+    
+    Returns: dict of throughput, percentiles of the per-batch mean
+    latency (seconds per operation) and peak traced memory in bytes
+    """
+    run = workload(seed)
+    batch_size = max(1, operations // batches)
+    batch_means = []
+    done = 0
+    start = time.perf_counter()
+    while done < operations:
+        count = min(batch_size, operations - done)
+        batch_start = time.perf_counter()
+        run(count)
+        batch_means.append((time.perf_counter() - batch_start) / count)
+        done += count
+    elapsed = time.perf_counter() - start
+    batch_means.sort()
+    
+    result = {
+        'operations': operations,
+        'seconds': elapsed,
+        'ops_per_second': operations / elapsed if elapsed else float('inf'),
+        'batches': len(batch_means),
+        'batch_mean_latency_p50': _percentile(batch_means, 0.50),
+        'batch_mean_latency_p90': _percentile(batch_means, 0.90),
+        'batch_mean_latency_p99': _percentile(batch_means, 0.99),
+        'peak_memory_bytes': None,
+    }
+    
+    if memory:
+        tracemalloc.start()
+        run = workload(seed)
+        done = 0
+        while done < operations:
+            count = min(batch_size, operations - done)
+            run(count)
+            done += count
+        result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Names of runs whose throughput fell by more than threshold"""
+    regressions = []
+    for key, result in results.items():
+        old = baseline.get('results', {}).get(key)
+        if old is None:
+            continue
+        change = result['ops_per_second'] / old['ops_per_second'] - 1
+        result['change_vs_baseline'] = change
+        if change < -threshold:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[3, 4, 5],
+                        help="run 10^k operations for each k (default: 3 4 5)")
+    parser.add_argument('--only', nargs='+', choices=sorted(WORKLOADS),
+                        help="run only these workloads")
+    parser.add_argument('--seed', type=int, default=12345)
+    parser.add_argument('--no-memory', action='store_true',
+                        help="skip the tracemalloc pass (halves the run time)")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--baseline', help="JSON file from an earlier --output run")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed throughput drop vs the baseline (default 0.10 = 10%%)")
+    args = parser.parse_args(argv)
+    
+    results = {}
+    print(f"{'workload':42s} {'ops':>10s} {'ops/s':>12s} {'batch p50 us':>12s} {'batch p99 us':>12s} {'peak KiB':>9s}")
+    for name in args.only or WORKLOADS:
+        for scale in args.scales:
+            operations = 10 ** scale
+            result = measure(WORKLOADS[name], operations, args.seed, memory=not args.no_memory)
+            results[f"{name}@1e{scale}"] = result
+            peak = result['peak_memory_bytes']
+            print(f"{name:42s} {operations:>10,} {result['ops_per_second']:>12,.0f} "
+                  f"{result['batch_mean_latency_p50'] * 1e6:>12.3f} "
+                  f"{result['batch_mean_latency_p99'] * 1e6:>12.3f} "
+                  f"{'-' if peak is None else f'{peak / 1024:.0f}':>9s}")
+    
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        print()
+        for key in regressions:
+            print(f"REGRESSION {key}: {results[key]['change_vs_baseline']:+.1%} throughput vs baseline")
+        if not regressions:
+            print(f"No regressions beyond {args.threshold:.0%} vs {args.baseline}")
+    
+    if args.output:
+        report = {
+            'meta': {
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'seed': args.seed,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Average sample number of sequential testing vs fixed-length testing.
+
+Simulates a screening cohort with the medical example's test (2%
+prevalence, 95% sensitivity, 3% false positive rate). Every patient has up
+to --max-tests results available. Fixed-length processing uses all of
+them; sequential processing (BayesianUpdater.update_until) stops once
+P(Disease) crosses either threshold.
+
+    python benchmarks/sprt_sample_size.py --patients 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from probability_playground.bayesian_updating import BayesianUpdater  # noqa: E402
+
+PRIOR = {'Disease': 0.02, 'No Disease': 0.98}
+LIKELIHOOD = {
+    'Positive': {'Disease': 0.95, 'No Disease': 0.03},
+    'Negative': {'Disease': 0.05, 'No Disease': 0.97},
+}
+
+
+def make_cohort(patients, max_tests, seed):
+    """List of (has_disease, test results) with a fixed seed"""
+    rng = random.Random(seed)
+    cohort = []
+    for _ in range(patients):
+        sick = rng.random() < PRIOR['Disease']
+        p_positive = LIKELIHOOD['Positive']['Disease' if sick else 'No Disease']
+        results = ['Positive' if rng.random() < p_positive else 'Negative' for _ in range(max_tests)]
+        cohort.append((sick, results))
+    return cohort
+
+
+def run_fixed(cohort, accept_at):
+    start = time.perf_counter()
+    tests = errors = 0
+    for sick, results in cohort:
+        doctor = BayesianUpdater(PRIOR, LIKELIHOOD)
+        for result in results:
+            doctor.update(result)
+        tests += len(results)
+        errors += (doctor.current_belief['Disease'] >= accept_at) != sick
+    return tests, errors, time.perf_counter() - start
+
+
+def run_sequential(cohort, accept_at, reject_at):
+    start = time.perf_counter()
+    tests = errors = undecided = 0
+    for sick, results in cohort:
+        doctor = BayesianUpdater(PRIOR, LIKELIHOOD)
+        outcome = doctor.update_until(results, 'Disease', accept_at, reject_at)
+        tests += outcome['observations']
+        if outcome['decision'] == 'undecided':
+            undecided += 1
+            errors += (outcome['posterior']['Disease'] >= accept_at) != sick
+        else:
+            errors += (outcome['decision'] == 'accept') != sick
+    return tests, errors, undecided, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--patients', type=int, default=20000)
+    parser.add_argument('--max-tests', type=int, default=10)
+    parser.add_argument('--accept-at', type=float, default=0.99)
+    parser.add_argument('--reject-at', type=float, default=0.001)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+    
+    cohort = make_cohort(args.patients, args.max_tests, args.seed)
+    fixed_tests, fixed_errors, fixed_time = run_fixed(cohort, args.accept_at)
+    seq_tests, seq_errors, undecided, seq_time = run_sequential(cohort, args.accept_at, args.reject_at)
+    
+    print(f"Patients: {args.patients}, up to {args.max_tests} tests each")
+    print(f"Fixed length: {fixed_tests / args.patients:6.2f} tests/patient, "
+          f"{fixed_errors} misclassified, {fixed_time:.2f} s")
+    print(f"Sequential:   {seq_tests / args.patients:6.2f} tests/patient, "
+          f"{seq_errors} misclassified, {undecided} undecided, {seq_time:.2f} s")
+    print(f"Evidence processed: {seq_tests / fixed_tests:.1%} of fixed length")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
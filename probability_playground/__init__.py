@@ -0,0 +1,138 @@
+"""
+Probability Playground: core probability concepts in plain Python.
+
+Importing the package does no work. Each name below is loaded from its
+submodule the first time it is used, e.g.
+
+    import probability_playground as pp
+    pp.addition_rule(0.5, 0.4, 0.1)
+
+Run `python -m probability_playground` to see the demos.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    # basic_probability
+    'calculate_basic_probability': 'basic_probability',
+    'calculate_basic_probability_batch': 'basic_probability',
+    'read_probability_rows': 'basic_probability',
+    'bulk_basic_probability': 'basic_probability',
+    # probability_types
+    'ProbabilityCalculator': 'probability_types',
+    # event_relationships
+    'are_mutually_exclusive': 'event_relationships',
+    'are_independent': 'event_relationships',
+    'conditional_probability': 'event_relationships',
+    # probability_rules
+    'addition_rule': 'probability_rules',
+    'multiplication_rule': 'probability_rules',
+    'complement_rule': 'probability_rules',
+    'calculate_probability': 'probability_rules',
+    'reduce_exact': 'probability_rules',
+    'reduce_exact_batch': 'probability_rules',
+    'exact_equal': 'probability_rules',
+    'exact_to_float': 'probability_rules',
+    'check_probability_batch': 'probability_rules',
+    'addition_rule_batch': 'probability_rules',
+    'multiplication_rule_batch': 'probability_rules',
+    'complement_rule_batch': 'probability_rules',
+    'index_sample_space': 'probability_rules',
+    'event_bitmask': 'probability_rules',
+    'union_probability_from_outcomes': 'probability_rules',
+    'union_probability': 'probability_rules',
+    'bonferroni_bounds': 'probability_rules',
+    'ChainRuleEvaluator': 'probability_rules',
+    'SurveyCrossTab': 'probability_rules',
+    # card_simulations
+    'SimpleRandom': 'card_simulations',
+    'create_deck': 'card_simulations',
+    'simulate_draws': 'card_simulations',
+    'Shoe': 'card_simulations',
+    'experimental_probability': 'card_simulations',
+    'theoretical_probability': 'card_simulations',
+    # card_estimators
+    'plain_estimate': 'card_estimators',
+    'antithetic_estimate': 'card_estimators',
+    'control_variate_estimate': 'card_estimators',
+    'stratified_estimate': 'card_estimators',
+    'first_card_suit_strata': 'card_estimators',
+    'importance_four_of_a_kind': 'card_estimators',
+    # hand_evaluator
+    'encode_card': 'hand_evaluator',
+    'encode_hand': 'hand_evaluator',
+    'evaluate5': 'hand_evaluator',
+    'evaluate': 'hand_evaluator',
+    'evaluate_batch': 'hand_evaluator',
+    'hand_category': 'hand_evaluator',
+    'category_counts': 'hand_evaluator',
+    'deal_hands': 'hand_evaluator',
+    # adaptive_simulation
+    'wilson_interval': 'adaptive_simulation',
+    'agresti_coull_interval': 'adaptive_simulation',
+    'run_until_precision': 'adaptive_simulation',
+    # alias_sampling
+    'AliasSampler': 'alias_sampling',
+    # checkpointing
+    'CheckpointedRun': 'checkpointing',
+    'draw_trial': 'checkpointing',
+    # streaming_estimators
+    'SlidingWindowEstimator': 'streaming_estimators',
+    'TimeWindowEstimator': 'streaming_estimators',
+    'DecayedEstimator': 'streaming_estimators',
+    # deck_dp
+    'DeckComposition': 'deck_dp',
+    'deck_counts': 'deck_dp',
+    'first_ace_by_draw': 'deck_dp',
+    'all_suits_within': 'deck_dp',
+    # bootstrap
+    'binomial_draw': 'bootstrap',
+    'multinomial_draw': 'bootstrap',
+    'bootstrap_histograms': 'bootstrap',
+    'bootstrap_distributions': 'bootstrap',
+    'percentile_intervals': 'bootstrap',
+    'bca_intervals': 'bootstrap',
+    'experimental_interval': 'bootstrap',
+    # bayesian_updating
+    'BayesianUpdater': 'bayesian_updating',
+    'SparseBayesianUpdater': 'bayesian_updating',
+    'PosteriorCache': 'bayesian_updating',
+    'evidence_multiset': 'bayesian_updating',
+    'bayes_posterior': 'bayesian_updating',
+    'iter_bayes_grid': 'bayesian_updating',
+    'write_bayes_grid': 'bayesian_updating',
+    # bayesian_network
+    'Factor': 'bayesian_network',
+    'BayesianNetwork': 'bayesian_network',
+    'JunctionTree': 'bayesian_network',
+    # hidden_markov
+    'HiddenMarkovFilter': 'hidden_markov',
+    # live_updating
+    'LiveBeliefHub': 'live_updating',
+    # instrumentation (enable()/disable() stay on the submodule:
+    # pp.instrumentation.enable())
+    'Instrumentation': 'instrumentation',
+    'MemorySink': 'instrumentation',
+    'JsonlSink': 'instrumentation',
+    'PrometheusFileSink': 'instrumentation',
+    'prometheus_text': 'instrumentation',
+    'StackSampler': 'instrumentation',
+}
+
+_SUBMODULES = sorted(set(_EXPORTS.values()))
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return import_module(f'.{name}', __name__)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
@@ -0,0 +1,46 @@
+"""
+Run the demos.
+
+    python -m probability_playground                     # every demo
+    python -m probability_playground probability_rules   # just one
+"""
+import sys
+from importlib import import_module
+
+DEMOS = [
+    'basic_probability',
+    'probability_types',
+    'event_relationships',
+    'probability_rules',
+    'card_simulations',
+    'bayesian_updating',
+    'hidden_markov',
+    'live_updating',
+    'bayesian_network',
+    'card_estimators',
+    'adaptive_simulation',
+    'hand_evaluator',
+    'instrumentation',
+    'alias_sampling',
+    'deck_dp',
+    'bootstrap',
+    'checkpointing',
+    'streaming_estimators',
+]
+
+
+def main(argv=None):
+    names = sys.argv[1:] if argv is None else argv
+    unknown = [name for name in names if name not in DEMOS]
+    if unknown:
+        print(f"Unknown demo(s): {', '.join(unknown)}")
+        print(f"Available: {', '.join(DEMOS)}")
+        return 2
+    
+    for name in names or DEMOS:
+        import_module(f'probability_playground.{name}').main()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
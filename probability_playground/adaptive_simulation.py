@@ -0,0 +1,188 @@
+import time
+from statistics import NormalDist
+
+from .card_simulations import SimpleRandom, create_deck, simulate_draws
+
+
+def _z_value(confidence):
+    """z such that P(-z < Z < z) = confidence for a standard normal Z"""
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_interval(successes, trials, confidence=0.95):
+    """
+    Wilson score interval for a probability estimated as successes / trials
+    
+    Returns: (low, high)
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    z = _z_value(confidence)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    half_width = z * (p * (1 - p) / trials + z * z / (4 * trials * trials)) ** 0.5 / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+def agresti_coull_interval(successes, trials, confidence=0.95):
+    """
+    Agresti-Coull interval: add z^2/2 successes and failures, then use the
+    usual normal interval
+    
+    Returns: (low, high)
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    z = _z_value(confidence)
+    adjusted_trials = trials + z * z
+    p = (successes + z * z / 2) / adjusted_trials
+    half_width = z * (p * (1 - p) / adjusted_trials) ** 0.5
+    return max(0.0, p - half_width), min(1.0, p + half_width)
+
+
+_INTERVALS = {'wilson': wilson_interval, 'agresti-coull': agresti_coull_interval}
+
+
+def run_until_precision(trial, absolute_precision=None, relative_precision=None,
+                        confidence=0.95, interval='wilson', initial_batch=100, growth=2.0,
+                        max_trials=None, time_budget=None, random_gen=None):
+    """
+    Run trials in growing batches until the estimate is precise enough
+    
+    After each batch the interval half-width is compared with the targets.
+    The next batch is sized from the current estimate to just reach the
+    target, but never more than `growth` times the trials so far, so easy
+    events stop early and rare ones ramp up quickly.
+    
+    Parameters:
+    trial: function random_gen -> True/False (did the event happen?)
+    absolute_precision: target half-width
+    relative_precision: target half-width as a fraction of the estimate
+        (if both targets are given, both must be met; an event that is
+        never seen can't meet a relative target, so also give max_trials
+        or time_budget for very rare events)
+    confidence: interval confidence level
+    interval: 'wilson' or 'agresti-coull'
+    initial_batch: size of the first batch
+    growth: largest factor the total number of trials grows per batch
+    max_trials: stop after this many trials
+    time_budget: stop after about this many seconds
+    random_gen: SimpleRandom (or anything trial accepts)
+    
+    Returns: dict with 'estimate', 'interval', 'trials', 'successes',
+    'stopped_by' ('precision', 'max_trials' or 'time_budget') and 'seconds'
+    """
+    if absolute_precision is None and relative_precision is None \
+            and max_trials is None and time_budget is None:
+        raise ValueError("Give a precision target, max_trials or time_budget")
+    if interval not in _INTERVALS:
+        raise ValueError(f"interval must be one of {sorted(_INTERVALS)}")
+    if initial_batch < 1:
+        raise ValueError("initial_batch must be at least 1")
+    if growth <= 1:
+        raise ValueError("growth must be greater than 1")
+    if max_trials is not None and max_trials < 1:
+        raise ValueError("max_trials must be at least 1")
+    interval_func = _INTERVALS[interval]
+    random_gen = random_gen or SimpleRandom()
+    z = _z_value(confidence)
+    
+    start = time.perf_counter()
+    trials = successes = 0
+    batch = initial_batch
+    stopped_by = None
+    
+    while stopped_by is None:
+        if max_trials is not None:
+            batch = min(batch, max_trials - trials)
+        for _ in range(batch):
+            if trial(random_gen):
+                successes += 1
+        trials += batch
+        elapsed = time.perf_counter() - start
+        
+        low, high = interval_func(successes, trials, confidence)
+        half_width = (high - low) / 2
+        estimate = successes / trials
+        absolute_ok = absolute_precision is None or half_width <= absolute_precision
+        relative_ok = relative_precision is None or (
+            successes > 0 and half_width <= relative_precision * estimate)
+        has_target = absolute_precision is not None or relative_precision is not None
+        
+        if has_target and absolute_ok and relative_ok:
+            stopped_by = 'precision'
+        elif max_trials is not None and trials >= max_trials:
+            stopped_by = 'max_trials'
+        elif time_budget is not None and elapsed >= time_budget:
+            stopped_by = 'time_budget'
+        else:
+            # Trials needed for the target half-width at the current estimate
+            # (Agresti-Coull style shrinkage keeps this finite when p = 0)
+            p = (successes + z * z / 2) / (trials + z * z)
+            targets = []
+            if absolute_precision is not None:
+                targets.append(absolute_precision)
+            if relative_precision is not None:
+                targets.append(relative_precision * p)
+            needed = z * z * p * (1 - p) / min(targets) ** 2 if targets else float('inf')
+            batch = int(min(max(needed - trials, initial_batch), trials * (growth - 1)))
+            batch = max(batch, 1)
+            if time_budget is not None:
+                per_trial = elapsed / trials
+                if per_trial > 0:
+                    batch = max(1, min(batch, int((time_budget - elapsed) / per_trial) + 1))
+    
+    return {
+        'estimate': successes / trials,
+        'interval': interval_func(successes, trials, confidence),
+        'trials': trials,
+        'successes': successes,
+        'stopped_by': stopped_by,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def adaptive_card_demonstrations():
+    print("=== ADAPTIVE SIMULATION ===")
+    print("Trials run in growing batches until the 95% Wilson interval is tight enough.")
+    print()
+    
+    deck = create_deck()
+    
+    def heart(random_gen):
+        return deck[random_gen.randint(0, 51)].endswith('H')
+    
+    def same_suit(random_gen):
+        first, second = simulate_draws(deck, 2, with_replacement=False, random_gen=random_gen)
+        return first[-1] == second[-1]
+    
+    def four_of_a_kind(random_gen):
+        ranks = [card[:-1] for card in simulate_draws(deck, 5, with_replacement=False,
+                                                      random_gen=random_gen)]
+        return any(ranks.count(rank) == 4 for rank in ranks)
+    
+    runs = [
+        ("P(Heart) to ±0.01", heart, {'absolute_precision': 0.01}),
+        ("P(same suit) to ±5%", same_suit, {'relative_precision': 0.05}),
+        ("P(four of a kind) to ±50%, 2 s budget", four_of_a_kind,
+         {'relative_precision': 0.5, 'time_budget': 2.0}),
+    ]
+    for label, trial, options in runs:
+        result = run_until_precision(trial, random_gen=SimpleRandom(seed=7), **options)
+        low, high = result['interval']
+        print(f"{label}:")
+        print(f"   estimate {result['estimate']:.5f}, interval [{low:.5f}, {high:.5f}]")
+        print(f"   {result['trials']:,} trials, stopped by {result['stopped_by']} "
+              f"after {result['seconds']:.2f} s")
+        print()
+
+
+def main():
+    adaptive_card_demonstrations()
+
+
+if __name__ == "__main__":
+    main()
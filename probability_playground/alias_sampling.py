@@ -0,0 +1,218 @@
+from bisect import bisect_right
+
+from .card_simulations import SimpleRandom
+from .probability_types import ProbabilityCalculator
+
+
+class AliasSampler:
+    """
+    Draw outcomes from a discrete distribution in O(1) per draw.
+    
+    Walker's alias method (Vose's version): the n outcomes are split into n
+    equal-width columns; column i keeps outcome i with probability prob[i]
+    and otherwise gives alias[i]. A draw picks a column and flips one
+    biased coin, whatever the number of outcomes. Building the table is
+    O(n).
+    """
+    
+    def __init__(self, probabilities):
+        """
+        Parameters:
+        probabilities: dict outcome -> probability (or any non-negative
+            weights), e.g. the output of empirical_probability
+        """
+        self.counts = None
+        self._build(probabilities)
+        self._extra = {}
+        self._deficit = 0
+        self._cumulative = None
+    
+    @classmethod
+    def from_counts(cls, observed_frequencies):
+        """
+        Build from observed counts (via empirical_probability) and keep the
+        counts so update_counts can change them later
+        """
+        sampler = cls(ProbabilityCalculator().empirical_probability(observed_frequencies))
+        sampler.counts = dict(observed_frequencies)
+        sampler._set_base()
+        return sampler
+    
+    def _set_base(self):
+        """Remember the counts the alias table was built from"""
+        self._base_counts = dict(self.counts)
+        self._base_total = sum(self.counts.values())
+        self._max_extra = max(16, int(len(self.counts) ** 0.5))
+        self._extra = {}
+        self._deficit = 0
+        self._cumulative = None
+    
+    def _build(self, probabilities):
+        outcomes = list(probabilities)
+        weights = [probabilities[o] for o in outcomes]
+        total = sum(weights)
+        if not outcomes or total <= 0:
+            raise ValueError("Need at least one outcome with positive probability")
+        if any(w < 0 for w in weights):
+            raise ValueError("Probabilities can't be negative")
+        
+        n = len(outcomes)
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, s in enumerate(scaled) if s < 1.0]
+        large = [i for i, s in enumerate(scaled) if s >= 1.0]
+        
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            # The large column gives away what the small one was missing
+            scaled[g] = scaled[g] + scaled[s] - 1.0
+            if scaled[g] < 1.0:
+                small.append(g)
+            else:
+                large.append(g)
+        # Whatever is left is 1 up to rounding error
+        for i in small + large:
+            prob[i] = 1.0
+        
+        self.outcomes = outcomes
+        self.prob = prob
+        self.alias = alias
+        self._dirty = False
+    
+    def update_counts(self, changes):
+        """
+        Add count changes, e.g. {'Rainy': +3, 'Sunny': -1}
+        
+        The alias table is not rebuilt on every change. Until the next
+        rebuild, draws come from a mix of the table (the counts it was
+        built from) and a short list of outcomes whose count has grown
+        since; an outcome whose count has shrunk is accepted only in
+        proportion to what is left, otherwise the draw is repeated. The
+        O(n) rebuild happens on the next draw once that list passes about
+        sqrt(n) outcomes or a quarter of the table's mass is gone, so
+        alternating updates and draws cost O(sqrt(n)) amortized instead
+        of O(n). Outcomes whose count drops to 0 are kept but never drawn.
+        """
+        if self.counts is None:
+            raise ValueError("update_counts needs a sampler built with from_counts")
+        base = self._base_counts
+        for outcome, delta in changes.items():
+            old = self.counts.get(outcome, 0)
+            count = old + delta
+            if count < 0:
+                raise ValueError(f"Count for {outcome!r} would become negative")
+            self.counts[outcome] = count
+            
+            base_count = base.get(outcome, 0)
+            self._deficit += max(0, base_count - count) - max(0, base_count - old)
+            if count > base_count:
+                self._extra[outcome] = count - base_count
+            else:
+                self._extra.pop(outcome, None)
+        
+        self._cumulative = None
+        if len(self._extra) > self._max_extra or 4 * self._deficit > self._base_total:
+            self._dirty = True
+    
+    def _refresh(self):
+        self._build(ProbabilityCalculator().empirical_probability(self.counts))
+        self._set_base()
+    
+    def _draw_changed(self, random_gen):
+        """One draw while there are count changes the table doesn't include"""
+        if self._cumulative is None:
+            self._extra_outcomes = list(self._extra)
+            self._cumulative = []
+            running = 0
+            for outcome in self._extra_outcomes:
+                running += self._extra[outcome]
+                self._cumulative.append(running)
+        extra_total = self._cumulative[-1] if self._cumulative else 0
+        base_total = self._base_total
+        if base_total - self._deficit + extra_total <= 0:
+            raise ValueError("Need at least one outcome with positive probability")
+        
+        n = len(self.outcomes)
+        while True:
+            u = random_gen.random() * (base_total + extra_total)
+            if u < base_total:
+                v = u / base_total * n
+                i = int(v)
+                outcome = self.outcomes[i] if v - i < self.prob[i] else self.outcomes[self.alias[i]]
+            else:
+                j = bisect_right(self._cumulative, u - base_total)
+                outcome = self._extra_outcomes[min(j, len(self._extra_outcomes) - 1)]
+            
+            proposed = self._base_counts.get(outcome, 0) + self._extra.get(outcome, 0)
+            count = self.counts[outcome]
+            if count == proposed or random_gen.random() * proposed < count:
+                return outcome
+    
+    def draw(self, random_gen):
+        """
+        One outcome
+        
+        random_gen needs a random() method returning a float in [0, 1),
+        like SimpleRandom or random.Random.
+        """
+        if self._dirty:
+            self._refresh()
+        if self._extra or self._deficit:
+            return self._draw_changed(random_gen)
+        u = random_gen.random() * len(self.outcomes)
+        i = int(u)
+        return self.outcomes[i] if u - i < self.prob[i] else self.outcomes[self.alias[i]]
+    
+    def draw_many(self, num_draws, random_gen):
+        """List of num_draws outcomes (same as calling draw repeatedly, but faster)"""
+        if self._dirty:
+            self._refresh()
+        if self._extra or self._deficit:
+            return [self._draw_changed(random_gen) for _ in range(num_draws)]
+        outcomes, prob, alias = self.outcomes, self.prob, self.alias
+        n = len(outcomes)
+        random = random_gen.random
+        result = []
+        append = result.append
+        for _ in range(num_draws):
+            u = random() * n
+            i = int(u)
+            append(outcomes[i] if u - i < prob[i] else outcomes[alias[i]])
+        return result
+
+
+def weather_sampling_example():
+    print("=== SAMPLING FROM EMPIRICAL PROBABILITIES ===")
+    weather_data = {'Sunny': 280, 'Rainy': 70, 'Cloudy': 15}
+    calc = ProbabilityCalculator()
+    probabilities = calc.empirical_probability(weather_data)
+    
+    sampler = AliasSampler(probabilities)
+    draws = sampler.draw_many(100000, SimpleRandom(seed=42))
+    simulated = calc.empirical_probability({o: draws.count(o) for o in probabilities})
+    
+    print("Observed weather:", weather_data)
+    print(f"   {'Outcome':8s} {'Empirical':>10s} {'Simulated':>10s}")
+    for outcome in probabilities:
+        print(f"   {outcome:8s} {probabilities[outcome]:10.4f} {simulated[outcome]:10.4f}")
+    print()
+    
+    print("After 200 more rainy days are recorded:")
+    sampler = AliasSampler.from_counts(weather_data)
+    sampler.update_counts({'Rainy': 200})
+    draws = sampler.draw_many(100000, SimpleRandom(seed=42))
+    simulated = calc.empirical_probability({o: draws.count(o) for o in sampler.counts})
+    for outcome, p in calc.empirical_probability(sampler.counts).items():
+        print(f"   {outcome:8s} {p:10.4f} {simulated[outcome]:10.4f}")
+
+
+def main():
+    weather_sampling_example()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+from array import array
+
+
+def calculate_basic_probability(favorable, total):
+    """
+    Calculate probability of an event happening.
+    
+    Formula: probability = favorable outcomes / total outcomes
+    
+    Example: 
+    - Probability of rolling a 3 on a die:
+      favorable = 1 (only one 3 on a die)
+      total = 6 (6 sides on a die)
+      probability = 1/6 ≈ 0.1667
+    """
+    
+    # Check if total is 0 (can't divide by zero)
+    if total == 0:
+        return 0.0
+    
+    # Make sure favorable isn't negative
+    if favorable < 0:
+        favorable = 0
+    
+    # Make sure favorable isn't more than total
+    if favorable > total:
+        favorable = total
+    
+    # Calculate probability
+    probability = favorable / total
+    
+    return probability
+
+
+# ==================== BULK MODE ====================
+# Bulk mode applies the same rules as calculate_basic_probability to many
+# (favorable, total) rows at once and reads/writes files chunk by chunk,
+# so memory use depends on chunk_size, not on the file size.
+#
+# File formats:
+# - 'csv': one "favorable,total" row per line (a header line is allowed);
+#   output is one probability per line
+# - 'binary': input is pairs of 64-bit signed ints, output is 64-bit
+#   floats, both in the machine's native byte order
+
+def calculate_basic_probability_batch(favorables, totals):
+    """
+    Calculate favorable/total for every row, with the same clamping as
+    calculate_basic_probability (total 0 -> 0.0, negative favorable -> 0,
+    favorable more than total -> total).
+    
+    Returns: List of probabilities
+    """
+    return [0.0 if total == 0 else min(max(favorable, 0), total) / total
+            for favorable, total in zip(favorables, totals)]
+
+
+def read_probability_rows(path, file_format='csv', chunk_size=100000):
+    """
+    Read (favorable, total) rows from a file in chunks.
+    
+    Yields: (favorables, totals) lists of at most chunk_size rows each
+    """
+    if file_format == 'csv':
+        with open(path) as f:
+            favorables, totals = [], []
+            for line_number, line in enumerate(f):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    fav, tot = line.split(',')[:2]
+                    fav, tot = int(fav), int(tot)
+                except ValueError:
+                    if line_number == 0:
+                        continue  # header line
+                    raise ValueError(f"Line {line_number + 1}: expected 'favorable,total', got {line!r}")
+                favorables.append(fav)
+                totals.append(tot)
+                if len(favorables) == chunk_size:
+                    yield favorables, totals
+                    favorables, totals = [], []
+            if favorables:
+                yield favorables, totals
+    
+    elif file_format == 'binary':
+        with open(path, 'rb') as f:
+            while True:
+                values = array('q')
+                try:
+                    values.fromfile(f, 2 * chunk_size)
+                except EOFError:
+                    pass  # last, shorter chunk
+                if len(values) % 2:
+                    raise ValueError("Binary input ends in the middle of a row")
+                if not values:
+                    break
+                yield values[0::2], values[1::2]
+    
+    else:
+        raise ValueError(f"Unknown file format: {file_format!r}")
+
+
+def bulk_basic_probability(input_path, output_path, input_format='csv',
+                           output_format='csv', chunk_size=100000):
+    """
+    Calculate probabilities for every row of input_path and write them to
+    output_path, one chunk at a time.
+    
+    Returns: Number of rows processed
+    """
+    if output_format not in ('csv', 'binary'):
+        raise ValueError(f"Unknown file format: {output_format!r}")
+    
+    rows = 0
+    with open(output_path, 'w' if output_format == 'csv' else 'wb') as out:
+        for favorables, totals in read_probability_rows(input_path, input_format, chunk_size):
+            probabilities = calculate_basic_probability_batch(favorables, totals)
+            if output_format == 'csv':
+                out.write('\n'.join(map(repr, probabilities)))
+                out.write('\n')
+            else:
+                array('d', probabilities).tofile(out)
+            rows += len(probabilities)
+    return rows
+
+
+def main():
+    # Simple examples
+    print("=== Simple Probability Examples ===")
+    print()
+
+    # Example 1: Coin toss
+    print("1. Coin Toss:")
+    print("Probability of heads when tossing a coin")
+    favorable = 1  # 1 head
+    total = 2      # 2 sides total
+    prob = calculate_basic_probability(favorable, total)
+    print(f"   Favorable: {favorable}, Total: {total}")
+    print(f"   Probability: {prob}")
+    print()
+
+    # Example 2: Dice roll
+    print("2. Dice Roll:")
+    print("Probability of rolling a 5 on a 6-sided die")
+    favorable = 1  # only one 5 on a die
+    total = 6      # 6 sides total
+    prob = calculate_basic_probability(favorable, total)
+    print(f"   Favorable: {favorable}, Total: {total}")
+    print(f"   Probability: {prob:.4f} (that's {prob*100:.1f}%)")
+    print()
+
+    # Example 3: Deck of cards
+    print("3. Deck of Cards:")
+    print("Probability of drawing a heart")
+    favorable = 13  # 13 hearts in a deck
+    total = 52      # 52 cards total
+    prob = calculate_basic_probability(favorable, total)
+    print(f"   Favorable: {favorable}, Total: {total}")
+    print(f"   Probability: {prob:.4f} (that's 1/4 or 25%)")
+    print()
+
+    # Example 4: Impossible event
+    print("4. Impossible Event:")
+    print("Probability of rolling a 7 on a 6-sided die")
+    favorable = 0  # no 7 on a regular die
+    total = 6
+    prob = calculate_basic_probability(favorable, total)
+    print(f"   Favorable: {favorable}, Total: {total}")
+    print(f"   Probability: {prob} (0 means impossible)")
+    print()
+
+    # Example 5: Certain event
+    print("5. Certain Event:")
+    print("Probability of rolling 1-6 on a 6-sided die")
+    favorable = 6  # all numbers are 1-6
+    total = 6
+    prob = calculate_basic_probability(favorable, total)
+    print(f"   Favorable: {favorable}, Total: {total}")
+    print(f"   Probability: {prob} (1 means certain)")
+    print()
+
+    # Interactive example
+    print("=== Try It Yourself ===")
+    print("Let's calculate the probability of something!")
+
+    try:
+        # Get user input
+        fav = int(input("How many ways can it happen? Example: For heads on a coin, enter 1: "))
+        tot = int(input("How many total possibilities? Example: For a coin, enter 2: "))
+
+        # Calculate probability
+        result = calculate_basic_probability(fav, tot)
+
+        # Show results
+        print(f"\nResult:")
+        print(f"Probability = {fav}/{tot} = {result:.4f}")
+        print(f"That's {result*100:.1f}%")
+
+        # Simple interpretation
+        if result == 0:
+            print("This is impossible!")
+        elif result == 1:
+            print("This is certain to happen!")
+        elif result < 0.5:
+            print("This is unlikely.")
+        elif result > 0.5:
+            print("This is likely.")
+        else:
+            print("This has an equal chance of happening or not.")
+
+    except ValueError:
+        print("Please enter whole numbers only!")
+
+
+if __name__ == "__main__":
+    main()
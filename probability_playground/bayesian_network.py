@@ -0,0 +1,493 @@
+class Factor:
+    """
+    Table of non-negative numbers over some discrete variables.
+    
+    Values are stored in one flat list with the last variable changing
+    fastest, e.g. for variables (A, B) with 2 states each:
+    [A0B0, A0B1, A1B0, A1B1].
+    """
+    
+    def __init__(self, variables, cardinalities, values):
+        self.variables = tuple(variables)
+        self.cardinalities = tuple(cardinalities)
+        self.values = list(values)
+        
+        strides = []
+        stride = 1
+        for card in reversed(self.cardinalities):
+            strides.append(stride)
+            stride *= card
+        self.strides = tuple(reversed(strides))
+        if stride != len(self.values):
+            raise ValueError(f"Factor over {self.variables} needs {stride} values, got {len(self.values)}")
+        self._position = {v: i for i, v in enumerate(self.variables)}
+    
+    def product(self, other):
+        """Pointwise product over the union of both factors' variables"""
+        variables = list(self.variables)
+        cards = list(self.cardinalities)
+        for variable, card in zip(other.variables, other.cardinalities):
+            if variable not in self._position:
+                variables.append(variable)
+                cards.append(card)
+        
+        stride_a = [self.strides[self._position[v]] if v in self._position else 0 for v in variables]
+        stride_b = [other.strides[other._position[v]] if v in other._position else 0 for v in variables]
+        
+        total = 1
+        for card in cards:
+            total *= card
+        
+        a, b = self.values, other.values
+        values = [0.0] * total
+        assignment = [0] * len(variables)
+        ia = ib = 0
+        last = len(variables) - 1
+        for k in range(total):
+            values[k] = a[ia] * b[ib]
+            # Advance the assignment like an odometer (last variable fastest)
+            for pos in range(last, -1, -1):
+                assignment[pos] += 1
+                if assignment[pos] < cards[pos]:
+                    ia += stride_a[pos]
+                    ib += stride_b[pos]
+                    break
+                assignment[pos] = 0
+                ia -= (cards[pos] - 1) * stride_a[pos]
+                ib -= (cards[pos] - 1) * stride_b[pos]
+        
+        return Factor(variables, cards, values)
+    
+    def sum_out(self, variable):
+        """Marginalize one variable away"""
+        pos = self._position[variable]
+        stride = self.strides[pos]
+        block = stride * self.cardinalities[pos]
+        values = [0.0] * (len(self.values) // self.cardinalities[pos])
+        for i, value in enumerate(self.values):
+            values[(i // block) * stride + i % stride] += value
+        return Factor(self.variables[:pos] + self.variables[pos + 1:],
+                      self.cardinalities[:pos] + self.cardinalities[pos + 1:], values)
+    
+    def marginal(self, keep):
+        """Sum out every variable not in keep"""
+        factor = self
+        for variable in self.variables:
+            if variable not in keep:
+                factor = factor.sum_out(variable)
+        return factor
+    
+    def reduce(self, variable, state):
+        """Fix variable to a state index and drop it from the factor"""
+        pos = self._position[variable]
+        stride = self.strides[pos]
+        card = self.cardinalities[pos]
+        values = [value for i, value in enumerate(self.values) if (i // stride) % card == state]
+        return Factor(self.variables[:pos] + self.variables[pos + 1:],
+                      self.cardinalities[:pos] + self.cardinalities[pos + 1:], values)
+    
+    def condition(self, variable, state):
+        """Zero every entry where variable != state (keeps the same variables)"""
+        pos = self._position[variable]
+        stride = self.strides[pos]
+        card = self.cardinalities[pos]
+        values = [value if (i // stride) % card == state else 0.0
+                  for i, value in enumerate(self.values)]
+        return Factor(self.variables, self.cardinalities, values)
+    
+    def normalized(self):
+        total = sum(self.values)
+        if total == 0:
+            return self
+        return Factor(self.variables, self.cardinalities, [v / total for v in self.values])
+
+
+def _unit_factor():
+    return Factor((), (), [1.0])
+
+
+def _size(variables, cardinality):
+    size = 1
+    for variable in variables:
+        size *= cardinality[variable]
+    return size
+
+
+def _reorder(factor, variables):
+    """Same factor with its variables in the given order"""
+    if factor.variables == tuple(variables):
+        return factor
+    cards = [factor.cardinalities[factor._position[v]] for v in variables]
+    source_strides = [factor.strides[factor._position[v]] for v in variables]
+    target = Factor(variables, cards, [0.0] * len(factor.values))
+    values = target.values
+    for k in range(len(values)):
+        index = 0
+        remainder = k
+        for stride, source_stride, card in zip(target.strides, source_strides, cards):
+            index += (remainder // stride) * source_stride
+            remainder %= stride
+        values[k] = factor.values[index]
+    return target
+
+
+def _min_fill_order(graph, to_eliminate, cardinality):
+    """
+    Greedy elimination order: always eliminate the variable that adds the
+    fewest new edges (fill-in), breaking ties by the size of the table it
+    creates. graph is a dict of neighbor sets and is modified in place.
+    
+    Returns: list of (variable, clique) where clique is the variable plus
+    its neighbors at the time it was eliminated
+    """
+    remaining = set(to_eliminate)
+    order = []
+    while remaining:
+        best = None
+        best_score = None
+        for variable in remaining:
+            neighbors = list(graph[variable])
+            fill = 0
+            for i in range(len(neighbors)):
+                for j in range(i + 1, len(neighbors)):
+                    if neighbors[j] not in graph[neighbors[i]]:
+                        fill += 1
+            weight = cardinality[variable]
+            for neighbor in neighbors:
+                weight *= cardinality[neighbor]
+            score = (fill, weight)
+            if best_score is None or score < best_score:
+                best, best_score = variable, score
+        
+        neighbors = graph.pop(best)
+        for a in neighbors:
+            graph[a].discard(best)
+            graph[a].update(n for n in neighbors if n != a)
+        order.append((best, frozenset(neighbors) | {best}))
+        remaining.remove(best)
+    return order
+
+
+class BayesianNetwork:
+    """
+    Discrete Bayesian network: each variable has a list of states, some
+    parents, and a table P(variable | parents).
+    
+    query() answers one question by variable elimination. compile() builds
+    a JunctionTree, which is slower to set up but answers every marginal
+    for a given set of evidence after one calibration.
+    """
+    
+    def __init__(self):
+        self.states = {}   # variable -> list of state names
+        self.parents = {}  # variable -> tuple of parent variables
+        self.cpts = {}     # variable -> Factor over parents + (variable,)
+    
+    def add_variable(self, name, states, parents=(), cpt=None):
+        """
+        Parameters:
+        name: variable name
+        states: list of state names, e.g. ['yes', 'no']
+        parents: parent variable names (must already be added)
+        cpt: P(name | parents). Without parents, a dict state -> probability.
+            With parents, a dict mapping a tuple of parent states to a dict
+            state -> probability, e.g. {('yes',): {'pos': 0.95, 'neg': 0.05}, ...}
+        """
+        if name in self.states:
+            raise ValueError(f"Variable {name!r} already exists")
+        parents = tuple(parents)
+        for parent in parents:
+            if parent not in self.states:
+                raise ValueError(f"Parent {parent!r} of {name!r} must be added first")
+        
+        states = list(states)
+        parent_rows = [()]
+        for parent in parents:
+            parent_rows = [row + (state,) for row in parent_rows for state in self.states[parent]]
+        
+        values = []
+        for row in parent_rows:
+            distribution = cpt if not parents else cpt[row]
+            total = sum(distribution.get(state, 0) for state in states)
+            if abs(total - 1) > 1e-6:
+                raise ValueError(f"P({name} | {row}) sums to {total}, not 1")
+            values.extend(distribution.get(state, 0) for state in states)
+        
+        self.states[name] = states
+        self.parents[name] = parents
+        cards = [len(self.states[p]) for p in parents] + [len(states)]
+        self.cpts[name] = Factor(parents + (name,), cards, values)
+    
+    def _state_index(self, variable, state):
+        try:
+            return self.states[variable].index(state)
+        except ValueError:
+            raise ValueError(f"{state!r} is not a state of {variable!r}") from None
+    
+    def _ancestors(self, variables):
+        """The variables plus all their ancestors"""
+        found = set()
+        stack = list(variables)
+        while stack:
+            variable = stack.pop()
+            if variable not in found:
+                found.add(variable)
+                stack.extend(self.parents[variable])
+        return found
+    
+    def _to_distribution(self, variable, factor):
+        factor = factor.normalized()
+        return dict(zip(self.states[variable], factor.values))
+    
+    def query(self, variable, evidence=None):
+        """
+        P(variable | evidence) by variable elimination
+        
+        Parameters:
+        variable: the variable asked about
+        evidence: dict variable -> observed state
+        
+        Returns: dict state -> probability
+        """
+        evidence = evidence or {}
+        if variable in evidence:
+            return {s: 1.0 if s == evidence[variable] else 0.0 for s in self.states[variable]}
+        
+        # Variables that are not ancestors of the query or evidence sum to 1
+        # and can be dropped before doing any work
+        relevant = self._ancestors([variable] + list(evidence))
+        factors = []
+        for name in relevant:
+            factor = self.cpts[name]
+            for observed, state in evidence.items():
+                if observed in factor.variables:
+                    factor = factor.reduce(observed, self._state_index(observed, state))
+            factors.append(factor)
+        
+        graph = {name: set() for name in relevant if name not in evidence}
+        for factor in factors:
+            for a in factor.variables:
+                graph[a].update(b for b in factor.variables if b != a)
+        cardinality = {name: len(self.states[name]) for name in relevant}
+        to_eliminate = [name for name in graph if name != variable]
+        
+        for eliminated, _ in _min_fill_order(graph, to_eliminate, cardinality):
+            bucket = [f for f in factors if eliminated in f.variables]
+            factors = [f for f in factors if eliminated not in f.variables]
+            combined = _unit_factor()
+            for factor in bucket:
+                combined = combined.product(factor)
+            factors.append(combined.sum_out(eliminated))
+        
+        result = _unit_factor()
+        for factor in factors:
+            result = result.product(factor)
+        return self._to_distribution(variable, result)
+    
+    def compile(self):
+        """Build a JunctionTree for fast repeated queries"""
+        return JunctionTree(self)
+
+
+class JunctionTree:
+    """
+    Clique tree of a BayesianNetwork for answering many marginal queries.
+    
+    Built once from a min-fill triangulation of the moral graph. After
+    set_evidence, the first query calibrates the tree with two passes of
+    messages; every later marginal is read from a single clique and cached.
+    """
+    
+    def __init__(self, network):
+        self.network = network
+        cardinality = {name: len(states) for name, states in network.states.items()}
+        
+        # Moral graph: connect each variable to its parents and co-parents
+        graph = {name: set() for name in network.states}
+        for name, parents in network.parents.items():
+            family = parents + (name,)
+            for a in family:
+                graph[a].update(b for b in family if b != a)
+        
+        cliques = []
+        for _, clique in _min_fill_order(graph, list(graph), cardinality):
+            if not any(clique <= other for other in cliques):
+                cliques = [other for other in cliques if not other < clique]
+                cliques.append(clique)
+        self.cliques = [tuple(sorted(c, key=repr)) for c in cliques]
+        
+        # Maximum-weight spanning tree on separator size (Kruskal)
+        candidates = []
+        for i in range(len(self.cliques)):
+            for j in range(i + 1, len(self.cliques)):
+                candidates.append((len(cliques[i] & cliques[j]), i, j))
+        candidates.sort(reverse=True)
+        group = list(range(len(self.cliques)))
+        
+        def find(i):
+            while group[i] != i:
+                group[i] = group[group[i]]
+                i = group[i]
+            return i
+        
+        self.neighbors = {i: [] for i in range(len(self.cliques))}
+        for _, i, j in candidates:
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                group[root_i] = root_j
+                self.neighbors[i].append(j)
+                self.neighbors[j].append(i)
+        
+        # Each CPT goes into the smallest clique holding its whole family
+        self.potentials = []
+        for clique in self.cliques:
+            self.potentials.append(Factor(clique, [cardinality[v] for v in clique],
+                                          [1.0] * _size(clique, cardinality)))
+        for name, cpt in network.cpts.items():
+            family = set(cpt.variables)
+            home = min((i for i, c in enumerate(cliques) if family <= c),
+                       key=lambda i: len(self.cliques[i]))
+            self.potentials[home] = self.potentials[home].product(cpt).marginal(self.cliques[home])
+            # product() may reorder variables; put them back in clique order
+            self.potentials[home] = _reorder(self.potentials[home], self.cliques[home])
+        
+        self._home_of = {}
+        for name in network.states:
+            self._home_of[name] = min((i for i, c in enumerate(cliques) if name in c),
+                                      key=lambda i: len(self.cliques[i]))
+        
+        # Visit order for message passing: parents before children
+        self._order = []
+        self._parent = {}
+        seen = set()
+        for root in range(len(self.cliques)):
+            if root in seen:
+                continue
+            seen.add(root)
+            self._parent[root] = None
+            queue = [root]
+            while queue:
+                i = queue.pop(0)
+                self._order.append(i)
+                for j in self.neighbors[i]:
+                    if j not in seen:
+                        seen.add(j)
+                        self._parent[j] = i
+                        queue.append(j)
+        
+        self.evidence = {}
+        self._messages = None
+        self._marginals = {}
+    
+    def set_evidence(self, evidence=None):
+        """Replace the current evidence (dict variable -> observed state)"""
+        self.evidence = dict(evidence or {})
+        for variable, state in self.evidence.items():
+            self.network._state_index(variable, state)
+        self._messages = None
+        self._marginals = {}
+    
+    def _evidence_potentials(self):
+        potentials = list(self.potentials)
+        for variable, state in self.evidence.items():
+            home = self._home_of[variable]
+            potentials[home] = potentials[home].condition(
+                variable, self.network._state_index(variable, state))
+        return potentials
+    
+    def _message(self, potentials, messages, source, target):
+        """Shafer-Shenoy message from clique source to clique target"""
+        factor = potentials[source]
+        for k in self.neighbors[source]:
+            if k != target:
+                factor = factor.product(messages[(k, source)])
+        separator = set(self.cliques[source]) & set(self.cliques[target])
+        return factor.marginal(separator)
+    
+    def calibrate(self):
+        """Pass messages up to the roots and back down"""
+        potentials = self._evidence_potentials()
+        messages = {}
+        for i in reversed(self._order):
+            parent = self._parent[i]
+            if parent is not None:
+                messages[(i, parent)] = self._message(potentials, messages, i, parent)
+        for i in self._order:
+            for j in self.neighbors[i]:
+                if self._parent.get(j) == i:
+                    messages[(i, j)] = self._message(potentials, messages, i, j)
+        self._calibrated_potentials = potentials
+        self._messages = messages
+    
+    def marginal(self, variable):
+        """P(variable | current evidence) as a dict state -> probability"""
+        cached = self._marginals.get(variable)
+        if cached is not None:
+            return cached.copy()
+        if self._messages is None:
+            self.calibrate()
+        
+        home = self._home_of[variable]
+        belief = self._calibrated_potentials[home]
+        for k in self.neighbors[home]:
+            belief = belief.product(self._messages[(k, home)])
+        result = self.network._to_distribution(variable, belief.marginal({variable}))
+        self._marginals[variable] = result
+        return result.copy()
+    
+    def query(self, variable, evidence=None):
+        """Same as BayesianNetwork.query, reusing calibration when evidence repeats"""
+        evidence = dict(evidence or {})
+        if evidence != self.evidence:
+            self.set_evidence(evidence)
+        return self.marginal(variable)
+
+
+def wet_grass_example():
+    print("=== BAYESIAN NETWORK - WET GRASS ===")
+    print("Cloudy -> Sprinkler, Cloudy -> Rain, Sprinkler & Rain -> Wet Grass")
+    print()
+    
+    net = BayesianNetwork()
+    net.add_variable('Cloudy', ['yes', 'no'], cpt={'yes': 0.5, 'no': 0.5})
+    net.add_variable('Sprinkler', ['on', 'off'], ['Cloudy'], {
+        ('yes',): {'on': 0.1, 'off': 0.9},
+        ('no',): {'on': 0.5, 'off': 0.5},
+    })
+    net.add_variable('Rain', ['yes', 'no'], ['Cloudy'], {
+        ('yes',): {'yes': 0.8, 'no': 0.2},
+        ('no',): {'yes': 0.2, 'no': 0.8},
+    })
+    net.add_variable('Wet Grass', ['yes', 'no'], ['Sprinkler', 'Rain'], {
+        ('on', 'yes'): {'yes': 0.99, 'no': 0.01},
+        ('on', 'no'): {'yes': 0.90, 'no': 0.10},
+        ('off', 'yes'): {'yes': 0.90, 'no': 0.10},
+        ('off', 'no'): {'yes': 0.0, 'no': 1.0},
+    })
+    
+    evidence = {'Wet Grass': 'yes'}
+    print("1. VARIABLE ELIMINATION (one query at a time):")
+    for variable in ['Rain', 'Sprinkler', 'Cloudy']:
+        p = net.query(variable, evidence)
+        print(f"   P({variable} | Wet Grass) = {p}")
+    print()
+    
+    print("2. JUNCTION TREE (compile once, then every marginal is cheap):")
+    tree = net.compile()
+    print(f"   Cliques: {tree.cliques}")
+    tree.set_evidence(evidence)
+    for variable in ['Rain', 'Sprinkler', 'Cloudy']:
+        print(f"   P({variable} | Wet Grass) = {tree.marginal(variable)}")
+    print()
+    
+    print("3. EXPLAINING AWAY: the sprinkler was on, so rain is less likely")
+    p_rain = tree.query('Rain', {'Wet Grass': 'yes', 'Sprinkler': 'on'})['yes']
+    print(f"   P(Rain | Wet Grass, Sprinkler on) = {p_rain:.4f}")
+
+
+def main():
+    wet_grass_example()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,951 @@
+import hashlib
+import os
+import pickle
+import sys
+from array import array
+from collections import OrderedDict
+from itertools import islice
+from math import exp, log
+
+# Optional instrumentation (set by instrumentation.enable). While it is
+# None the only cost is one check per call.
+_probe = None
+
+
+def evidence_multiset(evidence_sequence):
+    """
+    Canonical form of a sequence of evidence, ignoring order.
+    
+    With a fixed likelihood, Bayesian updating gives the same posterior in
+    any order, so ['Positive', 'Negative'] and ['Negative', 'Positive'] share
+    the key (('Negative', 1), ('Positive', 1)).
+    """
+    counts = {}
+    for evidence in evidence_sequence:
+        counts[evidence] = counts.get(evidence, 0) + 1
+    return tuple(sorted(counts.items(), key=lambda item: repr(item[0])))
+
+
+class PosteriorCache:
+    """
+    LRU cache of posteriors keyed by (model, evidence multiset).
+    
+    The model part of the key is a fingerprint of the prior and likelihood,
+    so one cache can be shared by many updaters. Entries are evicted
+    least-recently-used first once their estimated size passes max_bytes.
+    If path is given, the cache is loaded from it on creation and written
+    back by save(). Only load cache files you wrote yourself (they are
+    pickles).
+    """
+    
+    def __init__(self, max_bytes=10_000_000, path=None):
+        self.max_bytes = max_bytes
+        self.path = path
+        self.entries = OrderedDict()  # key -> (posterior, size in bytes)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path is not None and os.path.exists(path):
+            self.load(path)
+    
+    @staticmethod
+    def entry_size(key, posterior):
+        """Rough memory footprint of one entry in bytes"""
+        size = sys.getsizeof(key) + sys.getsizeof(posterior)
+        for evidence, count in key[1]:
+            size += sys.getsizeof(evidence) + sys.getsizeof(count)
+        for hypothesis, prob in posterior.items():
+            size += sys.getsizeof(hypothesis) + sys.getsizeof(prob)
+        return size
+    
+    def get(self, key):
+        """Return a copy of the cached posterior, or None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0].copy()
+    
+    def put(self, key, posterior):
+        """Store a posterior, evicting old entries to stay under max_bytes"""
+        size = self.entry_size(key, posterior)
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.current_bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (posterior.copy(), size)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, old_size) = self.entries.popitem(last=False)
+            self.current_bytes -= old_size
+            self.evictions += 1
+    
+    def stats(self):
+        """Counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+        }
+    
+    def save(self, path=None):
+        """Write the cache to disk (atomically replacing any old file)"""
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path given for saving the cache")
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump([(key, entry[0]) for key, entry in self.entries.items()], f)
+        os.replace(temp_path, path)
+    
+    def load(self, path=None):
+        """Add the entries stored in a cache file (oldest first)"""
+        path = path or self.path
+        with open(path, 'rb') as f:
+            for key, posterior in pickle.load(f):
+                self.put(key, posterior)
+    
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        self.entries.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class BayesianUpdater:
+    def __init__(self, prior, likelihood, cache=None):
+        """
+        Initialize Bayesian Updater
+        
+        Parameters:
+        prior: dict of hypotheses and their probabilities
+        likelihood: dict of P(evidence|hypothesis)
+        cache: optional PosteriorCache used by posterior_for
+        """
+        self.prior = prior.copy()
+        self.likelihood = likelihood.copy()
+        self.current_belief = prior.copy()
+        self.cache = cache
+        self._model_key = None
+    
+    def model_key(self):
+        """Fingerprint of the prior and likelihood (stable across runs)"""
+        if self._model_key is None:
+            model = (
+                sorted((repr(h), repr(p)) for h, p in self.prior.items()),
+                sorted((repr(e), sorted((repr(h), repr(p)) for h, p in table.items()))
+                       for e, table in self.likelihood.items()),
+            )
+            self._model_key = hashlib.sha256(repr(model).encode()).hexdigest()
+        return self._model_key
+    
+    def normalize(self, probabilities):
+        """
+        Ensure probabilities sum to 1
+        """
+        total = sum(probabilities.values())
+        if _probe is not None:
+            _probe.count('normalizations')
+            if total == 0:
+                _probe.count('zero_mass_events')
+        if total == 0:
+            return probabilities
+        
+        normalized = {}
+        for hypothesis, prob in probabilities.items():
+            normalized[hypothesis] = prob / total
+        
+        return normalized
+    
+    def update(self, evidence_observed):
+        """
+        Update probabilities based on observed evidence using Bayes' Theorem
+        
+        Bayes' Theorem: P(H|E) = P(E|H) * P(H) / P(E)
+        where P(E) = sum over H of P(E|H) * P(H)
+        """
+        probe = _probe
+        if probe is not None:
+            started = probe.clock()
+        
+        # Calculate unnormalized posterior
+        unnormalized_posterior = {}
+        
+        for hypothesis in self.current_belief:
+            # Get P(E|H) from likelihood
+            p_evidence_given_hypothesis = self.likelihood.get(evidence_observed, {}).get(hypothesis, 0)
+            
+            # P(H) is current belief
+            p_hypothesis = self.current_belief[hypothesis]
+            
+            # Unnormalized posterior: P(E|H) * P(H)
+            unnormalized_posterior[hypothesis] = p_evidence_given_hypothesis * p_hypothesis
+        
+        # Normalize to get posterior
+        self.current_belief = self.normalize(unnormalized_posterior)
+        
+        if probe is not None:
+            probe.record('update', probe.clock() - started)
+            probe.count('updates')
+        
+        return self.current_belief.copy()
+    
+    def update_many(self, evidence_list):
+        """
+        Update with several pieces of evidence at once
+        
+        Gives the same result as calling update() for each item, but only
+        touches each hypothesis once per distinct piece of evidence.
+        """
+        probe = _probe
+        if probe is not None:
+            started = probe.clock()
+        
+        self.current_belief = self._apply_evidence_counts(self.current_belief,
+                                                          evidence_multiset(evidence_list))
+        
+        if probe is not None:
+            probe.record('update_many', probe.clock() - started)
+            probe.count('updates', len(evidence_list))
+        
+        return self.current_belief.copy()
+    
+    def update_until(self, evidence_stream, hypothesis, accept_at=0.99, reject_at=0.01,
+                     max_observations=None):
+        """
+        Sequential test: update one observation at a time and stop as soon
+        as P(hypothesis) reaches accept_at or drops to reject_at
+        
+        With two hypotheses this is Wald's sequential probability ratio
+        test: the posterior thresholds are thresholds on the log-likelihood
+        ratio shifted by the prior odds.
+        
+        Parameters:
+        evidence_stream: iterable of evidence (only consumed as far as needed)
+        hypothesis: the hypothesis being tested, e.g. 'Disease'
+        accept_at: stop and accept once P(hypothesis) >= accept_at
+        reject_at: stop and reject once P(hypothesis) <= reject_at
+        max_observations: stop undecided after this many observations
+        
+        Returns: dict with 'decision' ('accept', 'reject' or 'undecided'),
+        'observations' (number used) and 'posterior'
+        """
+        if not reject_at < accept_at:
+            raise ValueError("reject_at must be smaller than accept_at")
+        
+        decision = 'undecided'
+        observations = 0
+        # islice stops before pulling an item past max_observations
+        for evidence in islice(evidence_stream, max_observations):
+            p = self.update(evidence)[hypothesis]
+            observations += 1
+            if p >= accept_at:
+                decision = 'accept'
+                break
+            if p <= reject_at:
+                decision = 'reject'
+                break
+        
+        return {
+            'decision': decision,
+            'observations': observations,
+            'posterior': self.current_belief.copy(),
+        }
+    
+    def _apply_evidence_counts(self, belief, counts):
+        """
+        Posterior after seeing each evidence `count` times, starting from belief
+        
+        Multiplying by P(E|H)^count is the same as `count` separate updates.
+        The products are taken in log space and shifted by their maximum
+        before exponentiating, so long evidence multisets don't underflow
+        to an all-zero belief. A hypothesis with P(H) = 0 or P(E|H) = 0
+        for any observed evidence ends at 0, exactly as with update().
+        """
+        tables = [(self.likelihood.get(evidence, {}), count) for evidence, count in counts]
+        log_weights = {}
+        for hypothesis, p in belief.items():
+            log_weight = log(p) if p > 0 else None
+            for table, count in tables:
+                if log_weight is None:
+                    break
+                p_evidence = table.get(hypothesis, 0)
+                log_weight = log_weight + count * log(p_evidence) if p_evidence > 0 else None
+            log_weights[hypothesis] = log_weight
+        
+        finite = [w for w in log_weights.values() if w is not None]
+        if not finite:
+            # No hypothesis is compatible with the evidence
+            return self.normalize({hypothesis: 0.0 for hypothesis in belief})
+        
+        top = max(finite)
+        return self.normalize({hypothesis: exp(w - top) if w is not None else 0.0
+                               for hypothesis, w in log_weights.items()})
+    
+    def posterior_for(self, evidence_sequence):
+        """
+        Posterior after observing evidence_sequence, starting from the prior
+        
+        Does not change current_belief. Results are looked up in and stored
+        to the cache (if any), keyed by the evidence multiset.
+        """
+        counts = evidence_multiset(evidence_sequence)
+        if self.cache is None:
+            return self._apply_evidence_counts(self.prior, counts)
+        
+        key = (self.model_key(), counts)
+        posterior = self.cache.get(key)
+        if posterior is None:
+            posterior = self._apply_evidence_counts(self.prior, counts)
+            self.cache.put(key, posterior)
+        return posterior
+
+
+class SparseBayesianUpdater(BayesianUpdater):
+    """
+    BayesianUpdater for very large hypothesis spaces.
+    
+    Likelihoods are stored per evidence as two parallel tuples
+    (hypotheses, P(E|H)) holding only the non-zero entries, and hypotheses
+    whose probability drops to zero are removed from current_belief
+    instead of being kept as zeros. An update therefore only costs as much
+    as the smaller of the evidence's support and the surviving belief.
+    
+    With prune_below set, hypotheses whose posterior falls below that
+    floor are dropped as well; discarded_mass adds up the posterior
+    probability they had at the moment they were dropped. It is a record
+    of what was pruned, not an error bound: later evidence can favour a
+    dropped hypothesis so strongly that its exact posterior ends up large.
+    """
+    
+    def __init__(self, prior, likelihood, cache=None, prune_below=None):
+        """
+        Parameters:
+        prior: dict of hypotheses and their probabilities
+        likelihood: dict of P(evidence|hypothesis); missing entries are 0
+        cache: optional PosteriorCache used by posterior_for
+        prune_below: drop hypotheses whose posterior is below this
+        """
+        super().__init__({h: p for h, p in prior.items() if p > 0}, likelihood, cache)
+        self.prune_below = prune_below
+        self.discarded_mass = 0.0
+        self.pruned = 0
+        self.sparse_likelihood = {}
+        for evidence, table in likelihood.items():
+            support = [(h, p) for h, p in table.items() if p > 0]
+            self.sparse_likelihood[evidence] = (tuple(h for h, _ in support),
+                                                tuple(p for _, p in support))
+    
+    @classmethod
+    def from_index_lists(cls, hypotheses, prior, likelihood_lists, **options):
+        """
+        Build from hypothesis indices instead of nested dicts
+        
+        Parameters:
+        hypotheses: list of hypothesis names
+        prior: list of prior probabilities (same order)
+        likelihood_lists: {evidence: (indices, probabilities)}
+        """
+        likelihood = {}
+        for evidence, (indices, probabilities) in likelihood_lists.items():
+            likelihood[evidence] = {hypotheses[i]: p for i, p in zip(indices, probabilities)}
+        return cls(dict(zip(hypotheses, prior)), likelihood, **options)
+    
+    def _support(self, belief, evidence):
+        """(hypothesis, P(H), P(E|H)) for hypotheses where both are non-zero"""
+        hypotheses, probabilities = self.sparse_likelihood.get(evidence, ((), ()))
+        if len(belief) < len(hypotheses):
+            table = self.likelihood[evidence]
+            return [(h, p, table[h]) for h, p in belief.items() if table.get(h, 0) > 0]
+        get = belief.get
+        return [(h, get(h), p_evidence) for h, p_evidence in zip(hypotheses, probabilities) if get(h)]
+    
+    def _multiply(self, belief, evidence, power=1):
+        """
+        Unnormalized belief * P(E|H)^power, keeping only non-zero entries
+        
+        For power > 1 the products are formed in log space and scaled so
+        the largest is 1; otherwise they could all underflow to 0.
+        """
+        support = self._support(belief, evidence)
+        if power == 1:
+            return {h: p * p_evidence for h, p, p_evidence in support}
+        if not support:
+            return {}
+        log_weights = [(h, log(p) + power * log(p_evidence)) for h, p, p_evidence in support]
+        top = max(w for _, w in log_weights)
+        return {h: exp(w - top) for h, w in log_weights}
+    
+    def _prune(self, belief):
+        """Drop hypotheses below prune_below and renormalize"""
+        if self.prune_below is None or not belief:
+            return belief
+        floor = self.prune_below
+        removed = [h for h, p in belief.items() if p < floor]
+        if not removed or len(removed) == len(belief):
+            return belief
+        mass = 0.0
+        for h in removed:
+            mass += belief.pop(h)
+        self.discarded_mass += mass
+        self.pruned += len(removed)
+        return self.normalize(belief)
+    
+    def update(self, evidence_observed):
+        """
+        Bayes' theorem over the non-zero support only
+        
+        Hypotheses with P(E|H) = 0 leave current_belief. If no hypothesis
+        is compatible with the evidence the belief becomes empty (all
+        zero), matching BayesianUpdater.
+        """
+        probe = _probe
+        if probe is not None:
+            started = probe.clock()
+        
+        belief = self.normalize(self._multiply(self.current_belief, evidence_observed))
+        self.current_belief = self._prune(belief)
+        
+        if probe is not None:
+            probe.record('update', probe.clock() - started)
+            probe.count('updates')
+        
+        return self.current_belief.copy()
+    
+    def update_many(self, evidence_list):
+        super().update_many(evidence_list)
+        self.current_belief = self._prune(self.current_belief)
+        return self.current_belief.copy()
+    
+    def _apply_evidence_counts(self, belief, counts):
+        for evidence, count in counts:
+            belief = self.normalize(self._multiply(belief, evidence, count))
+        return belief
+    
+    def probability(self, hypothesis):
+        """P(hypothesis) under the current belief (0.0 if it was dropped)"""
+        return self.current_belief.get(hypothesis, 0.0)
+
+
+# Medical Diagnosis Problem Implementation
+def medical_diagnosis_example():
+    print("=== MEDICAL DIAGNOSIS - BAYESIAN UPDATING ===")
+    print("Scenario:")
+    print("- Disease prevalence: 2% of population")
+    print("- Test accuracy: 95% true positive, 3% false positive")
+    print()
+    
+    # Define hypotheses: Disease (D) and No Disease (¬D)
+    hypotheses = ['Disease', 'No Disease']
+    
+    # Step 1: Prior probabilities
+    prior = {
+        'Disease': 0.02,      # P(D) = 2%
+        'No Disease': 0.98    # P(¬D) = 98%
+    }
+    
+    print("1. PRIOR BELIEFS (before any test):")
+    for hypo, prob in prior.items():
+        print(f"   P({hypo}) = {prob:.4f} ({prob*100:.1f}%)")
+    print()
+    
+    # Step 2: Likelihoods P(Test Result | Hypothesis)
+    # True Positive: P(Positive Test | Disease) = 0.95
+    # False Positive: P(Positive Test | No Disease) = 0.03
+    # True Negative: P(Negative Test | No Disease) = 1 - 0.03 = 0.97
+    # False Negative: P(Negative Test | Disease) = 1 - 0.95 = 0.05
+    
+    likelihood = {
+        'Positive': {
+            'Disease': 0.95,      # True Positive Rate
+            'No Disease': 0.03    # False Positive Rate
+        },
+        'Negative': {
+            'Disease': 0.05,      # False Negative Rate (1 - 0.95)
+            'No Disease': 0.97    # True Negative Rate (1 - 0.03)
+        }
+    }
+    
+    print("2. TEST CHARACTERISTICS:")
+    print("   P(Positive | Disease) = 0.95 (True Positive Rate)")
+    print("   P(Positive | No Disease) = 0.03 (False Positive Rate)")
+    print("   P(Negative | Disease) = 0.05 (False Negative Rate)")
+    print("   P(Negative | No Disease) = 0.97 (True Negative Rate)")
+    print()
+    
+    # Create Bayesian Updater
+    doctor = BayesianUpdater(prior, likelihood)
+    
+    # Step 3: First test comes back POSITIVE
+    print("3. FIRST TEST RESULT: POSITIVE")
+    posterior_positive = doctor.update('Positive')
+    
+    print("   Bayes' Theorem Calculation:")
+    print("   P(Disease | Positive) = P(Positive | Disease) * P(Disease) / P(Positive)")
+    print(f"                         = 0.95 * 0.02 / [0.95*0.02 + 0.03*0.98]")
+    print(f"                         = 0.019 / 0.0484")
+    print(f"                         = {posterior_positive['Disease']:.4f}")
+    
+    print("\n   Updated beliefs after positive test:")
+    for hypo, prob in posterior_positive.items():
+        print(f"   P({hypo} | Positive) = {prob:.4f} ({prob*100:.1f}%)")
+    print()
+    
+    # Step 4: Second test comes back NEGATIVE
+    print("4. SECOND TEST RESULT: NEGATIVE (after positive)")
+    posterior_negative = doctor.update('Negative')
+    
+    print("   Updated beliefs after negative test:")
+    for hypo, prob in posterior_negative.items():
+        print(f"   P({hypo} | Positive then Negative) = {prob:.4f} ({prob*100:.1f}%)")
+    print()
+    
+    # Step 5: Show multiple test scenarios
+    print("5. MULTIPLE TEST SCENARIOS:")
+    
+    # Posteriors from the prior, cached by which results were seen (order
+    # doesn't matter, so Positive+Negative and Negative+Positive share one entry)
+    doctor2 = BayesianUpdater(prior, likelihood, cache=PosteriorCache())
+    
+    test_sequences = [
+        ['Positive'],                           # 1 positive
+        ['Positive', 'Positive'],               # 2 positives
+        ['Positive', 'Negative'],               # Mixed
+        ['Negative'],                           # 1 negative
+        ['Negative', 'Negative'],               # 2 negatives
+        ['Negative', 'Positive'],               # Mixed, other order
+    ]
+    
+    for i, sequence in enumerate(test_sequences):
+        final_prob = doctor2.posterior_for(sequence)['Disease']
+        
+        print(f"   Tests: {sequence}")
+        print(f"   Final P(Disease) = {final_prob:.6f} ({final_prob*100:.2f}%)")
+        print()
+    
+    stats = doctor2.cache.stats()
+    print(f"   Posterior cache: {stats['hits']} hits, {stats['misses']} misses")
+    print()
+    
+    # Step 6: Stop testing as soon as the answer is clear enough
+    print("6. SEQUENTIAL TESTING (stop at P(Disease) >= 99% or <= 0.1%):")
+    results = ['Positive', 'Positive', 'Positive', 'Negative', 'Positive']
+    doctor3 = BayesianUpdater(prior, likelihood)
+    outcome = doctor3.update_until(results, 'Disease', accept_at=0.99, reject_at=0.001)
+    print(f"   Available results: {results}")
+    print(f"   Decision: {outcome['decision']} after {outcome['observations']} of {len(results)} tests")
+    print(f"   P(Disease) = {outcome['posterior']['Disease']:.4f}")
+    print()
+
+
+def spam_filter_example():
+    """Another Bayesian updating example: Spam filter"""
+    print("=== SPAM FILTER - BAYESIAN UPDATING ===")
+    print("Scenario: Classifying emails as Spam or Not Spam")
+    print()
+    
+    # Prior: based on email statistics
+    prior = {
+        'Spam': 0.30,      # 30% of emails are spam
+        'Not Spam': 0.70   # 70% are not spam
+    }
+    
+    # Likelihood: P(word appears | email type)
+    likelihood = {
+        'word: "viagra"': {
+            'Spam': 0.80,      # 80% of spam emails contain "viagra"
+            'Not Spam': 0.01   # 1% of non-spam emails contain "viagra"
+        },
+        'word: "meeting"': {
+            'Spam': 0.05,      # 5% of spam emails contain "meeting"
+            'Not Spam': 0.40   # 40% of non-spam emails contain "meeting"
+        },
+        'word: "free"': {
+            'Spam': 0.60,      # 60% of spam emails contain "free"
+            'Not Spam': 0.10   # 10% of non-spam emails contain "free"
+        }
+    }
+    
+    # Create spam filter
+    filter = BayesianUpdater(prior, likelihood)
+    
+    print("Initial beliefs:")
+    for hypo, prob in prior.items():
+        print(f"  P({hypo}) = {prob:.4f}")
+    print()
+    
+    # Update with evidence
+    print("1. Email contains 'viagra':")
+    beliefs1 = filter.update('word: "viagra"')
+    print(f"   P(Spam | 'viagra') = {beliefs1['Spam']:.4f}")
+    print()
+    
+    print("2. Then we see it also contains 'meeting':")
+    beliefs2 = filter.update('word: "meeting"')
+    print(f"   P(Spam | 'viagra' and 'meeting') = {beliefs2['Spam']:.4f}")
+    print()
+    
+    print("3. Then we see it also contains 'free':")
+    beliefs3 = filter.update('word: "free"')
+    print(f"   P(Spam | all three words) = {beliefs3['Spam']:.4f}")
+    print()
+
+
+def coin_bias_example():
+    """Bayesian updating for coin bias detection"""
+    print("=== COIN BIAS DETECTION ===")
+    print("Scenario: Determining if a coin is fair or biased")
+    print()
+    
+    # Hypotheses about the coin
+    # Each hypothesis: P(Heads) = probability
+    prior = {
+        'Fair (P=0.5)': 0.70,      # 70% chance coin is fair
+        'Biased Heads (P=0.7)': 0.15,  # 15% chance biased toward heads
+        'Biased Tails (P=0.3)': 0.15   # 15% chance biased toward tails
+    }
+    
+    # Likelihood function for coin flips
+    def coin_likelihood(num_heads, num_flips, p_heads):
+        """Probability of getting num_heads out of num_flips if P(Heads)=p_heads"""
+        # For simplicity, we'll use binomial probability
+        # P(k heads in n flips) = C(n,k) * p^k * (1-p)^(n-k)
+        
+        # Since we're only comparing probabilities, we can ignore the binomial coefficient
+        # as it cancels out in normalization
+        return (p_heads ** num_heads) * ((1 - p_heads) ** (num_flips - num_heads))
+    
+    # Create simple test
+    print("Coin flip experiment:")
+    print("Prior beliefs:")
+    for hypo, prob in prior.items():
+        print(f"  {hypo}: {prob:.4f}")
+    print()
+    
+    # Simulate flipping the coin 10 times, getting 7 heads
+    num_flips = 10
+    num_heads = 7
+    
+    print(f"Flip coin {num_flips} times, get {num_heads} heads.")
+    
+    # Calculate likelihoods for this evidence
+    likelihoods = {
+        'Fair (P=0.5)': coin_likelihood(num_heads, num_flips, 0.5),
+        'Biased Heads (P=0.7)': coin_likelihood(num_heads, num_flips, 0.7),
+        'Biased Tails (P=0.3)': coin_likelihood(num_heads, num_flips, 0.3)
+    }
+    
+    print("\nLikelihoods for this evidence:")
+    for hypo, like in likelihoods.items():
+        print(f"  P({num_heads} heads in {num_flips} | {hypo}) = {like:.6f}")
+    print()
+    
+    # Calculate posterior manually to show Bayes' Theorem
+    unnormalized = {}
+    for hypo in prior:
+        unnormalized[hypo] = prior[hypo] * likelihoods[hypo]
+    
+    total = sum(unnormalized.values())
+    posterior = {}
+    for hypo in prior:
+        posterior[hypo] = unnormalized[hypo] / total
+    
+    print("Posterior beliefs after evidence:")
+    for hypo, prob in posterior.items():
+        print(f"  {hypo}: {prob:.4f}")
+    print()
+    
+    # Show how beliefs would update with more flips
+    print("If we flip 90 more times and get 63 heads (total 70/100):")
+    total_flips = 100
+    total_heads = 70
+    
+    likelihoods2 = {
+        'Fair (P=0.5)': coin_likelihood(total_heads, total_flips, 0.5),
+        'Biased Heads (P=0.7)': coin_likelihood(total_heads, total_flips, 0.7),
+        'Biased Tails (P=0.3)': coin_likelihood(total_heads, total_flips, 0.3)
+    }
+    
+    unnormalized2 = {}
+    for hypo in prior:
+        unnormalized2[hypo] = prior[hypo] * likelihoods2[hypo]
+    
+    total2 = sum(unnormalized2.values())
+    posterior2 = {}
+    for hypo in prior:
+        posterior2[hypo] = unnormalized2[hypo] / total2
+    
+    print("Final beliefs after 100 flips:")
+    for hypo, prob in posterior2.items():
+        print(f"  {hypo}: {prob:.4f}")
+    print()
+    
+    # Flip-by-flip with early stopping
+    print("Flip by flip, stopping once P(Biased Heads) reaches 95% or drops to 5%:")
+    flip_likelihood = {
+        'H': {'Fair (P=0.5)': 0.5, 'Biased Heads (P=0.7)': 0.7, 'Biased Tails (P=0.3)': 0.3},
+        'T': {'Fair (P=0.5)': 0.5, 'Biased Heads (P=0.7)': 0.3, 'Biased Tails (P=0.3)': 0.7},
+    }
+    flips = 'HHTHHHTHHHHTHHHTHHHHTHHHTHHHHHTHHHHTHHHHHHTHHHH'
+    coin = BayesianUpdater(prior, flip_likelihood)
+    outcome = coin.update_until(flips, 'Biased Heads (P=0.7)', accept_at=0.95, reject_at=0.05)
+    print(f"  Decision on 'Biased Heads': {outcome['decision']} after "
+          f"{outcome['observations']} of {len(flips)} flips")
+    print(f"  P(Biased Heads) = {outcome['posterior']['Biased Heads (P=0.7)']:.4f}")
+
+
+# ==================== BAYES' THEOREM OVER GRIDS ====================
+GRID_COLUMNS = ('p_a', 'p_b_given_a', 'p_b_given_not_a', 'p_a_given_b', 'p_not_a_given_not_b')
+
+
+def bayes_posterior(p_a, p_b_given_a, p_b_given_not_a):
+    """
+    P(A|B) = P(B|A) * P(A) / P(B)
+    
+    Returns: P(A|B), or 0.0 when P(B) = 0
+    """
+    p_b = p_b_given_a * p_a + p_b_given_not_a * (1 - p_a)
+    if p_b == 0:
+        return 0.0
+    return p_b_given_a * p_a / p_b
+
+
+def _check_grid_value(name, value):
+    if not 0 <= value <= 1:
+        raise ValueError(f"{name} values must be between 0 and 1, got {value}")
+
+
+def iter_bayes_grid(p_a_values, p_b_given_a_values, p_b_given_not_a_values, chunk_size=100000):
+    """
+    Bayes' theorem for every combination of the three input lists
+    
+    For a diagnostic test (A = has condition, B = tests positive) the two
+    outputs are the positive and negative predictive values:
+    PPV = P(A|B) and NPV = P(not A|not B). Cells where P(B) or P(not B) is
+    0 get 0.0 instead of raising.
+    
+    Memory stays at about chunk_size rows: P(A) values are read one at a
+    time (any iterable works) and the P(B|not A) axis is processed in
+    slices. The last two inputs are needed more than once, so they should
+    be sequences (list, range-like or array('d')); other iterables are
+    read into a list first.
+    
+    Parameters:
+    p_a_values: prevalences / priors P(A)
+    p_b_given_a_values: P(B|A) (sensitivity)
+    p_b_given_not_a_values: P(B|not A) (1 - specificity)
+    chunk_size: rows per chunk
+    
+    Yields: tuples of 5 equal-length lists, in the order of GRID_COLUMNS,
+    with at most chunk_size rows. P(B|not A) varies fastest.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if not hasattr(p_b_given_a_values, '__getitem__'):
+        p_b_given_a_values = list(p_b_given_a_values)
+    inner = p_b_given_not_a_values
+    if not (hasattr(inner, '__getitem__') and hasattr(inner, '__len__')):
+        inner = list(inner)
+    
+    columns = tuple([] for _ in GRID_COLUMNS)
+    first_pass = True  # inputs are checked the first time they are used
+    
+    for p_a in p_a_values:
+        _check_grid_value('P(A)', p_a)
+        p_not_a = 1 - p_a
+        for sensitivity in p_b_given_a_values:
+            _check_grid_value('P(B|A)', sensitivity)
+            true_positive = sensitivity * p_a
+            false_negative = (1 - sensitivity) * p_a
+            
+            start = 0
+            while start < len(inner):
+                stop = min(len(inner), start + chunk_size - len(columns[0]))
+                piece = inner[start:stop]
+                if first_pass:
+                    for false_positive_rate in piece:
+                        _check_grid_value('P(B|not A)', false_positive_rate)
+                
+                ppv = []
+                npv = []
+                for false_positive_rate in piece:
+                    p_b = true_positive + false_positive_rate * p_not_a
+                    true_negative = (1 - false_positive_rate) * p_not_a
+                    p_not_b = false_negative + true_negative
+                    ppv.append(true_positive / p_b if p_b else 0.0)
+                    npv.append(true_negative / p_not_b if p_not_b else 0.0)
+                
+                columns[0].extend([p_a] * len(piece))
+                columns[1].extend([sensitivity] * len(piece))
+                columns[2].extend(piece)
+                columns[3].extend(ppv)
+                columns[4].extend(npv)
+                start = stop
+                
+                if len(columns[0]) == chunk_size:
+                    yield columns
+                    columns = tuple([] for _ in GRID_COLUMNS)
+            first_pass = False
+    
+    if columns[0]:
+        yield columns
+
+
+def write_bayes_grid(path, p_a_values, p_b_given_a_values, p_b_given_not_a_values,
+                     file_format='csv', chunk_size=100000):
+    """
+    Evaluate iter_bayes_grid and write it to path one chunk at a time, so
+    memory stays fixed however many cells there are
+    
+    file_format 'csv' writes a header line and one row per cell; 'binary'
+    writes 5 doubles per cell (GRID_COLUMNS order, native byte order), to
+    be read back with array('d').fromfile.
+    
+    Returns: Number of cells written
+    """
+    if file_format not in ('csv', 'binary'):
+        raise ValueError(f"Unknown file format: {file_format!r}")
+    
+    cells = 0
+    with open(path, 'w' if file_format == 'csv' else 'wb') as out:
+        if file_format == 'csv':
+            out.write(','.join(GRID_COLUMNS) + '\n')
+        for columns in iter_bayes_grid(p_a_values, p_b_given_a_values,
+                                       p_b_given_not_a_values, chunk_size):
+            if file_format == 'csv':
+                out.write('\n'.join(','.join(map(repr, row)) for row in zip(*columns)))
+                out.write('\n')
+            else:
+                values = array('d', bytes(8 * 5 * len(columns[0])))
+                for offset, column in enumerate(columns):
+                    values[offset::5] = array('d', column)
+                values.tofile(out)
+            cells += len(columns[0])
+    return cells
+
+
+def test_policy_grid_example():
+    """PPV / NPV of a screening test across prevalences and specificities"""
+    print("=== PREDICTIVE VALUES OVER A GRID ===")
+    print("Sensitivity P(B|A) = 0.95; rows: prevalence P(A), columns: specificity")
+    print()
+    prevalences = [0.001, 0.01, 0.05, 0.20]
+    specificities = [0.90, 0.95, 0.99, 0.999]
+    false_positive_rates = [1 - s for s in specificities]
+    
+    (p_as, _, _, ppvs, npvs), = iter_bayes_grid(prevalences, [0.95], false_positive_rates)
+    for label, values in (("PPV = P(A|B)", ppvs), ("NPV = P(not A|not B)", npvs)):
+        print(label)
+        print("  specificity:" + "".join(f"{s:>9.3f}" for s in specificities))
+        for i, p_a in enumerate(prevalences):
+            row = values[i * len(specificities):(i + 1) * len(specificities)]
+            print(f"  P(A)={p_a:<7} " + "".join(f"{v:9.4f}" for v in row))
+        print()
+    print("At 0.1% prevalence, half the positives of a 99.9%-specific test are false.")
+
+
+def sparse_location_example():
+    print("=== LOCATING A BEACON AMONG 100,000 POSITIONS ===")
+    print("Each sensor reading is only possible from ~300 positions,")
+    print("so the sparse updater never looks at the other 99,700.")
+    print()
+    
+    num_positions = 100000
+    prior = {position: 1 / num_positions for position in range(num_positions)}
+    
+    # Tower t hears the beacon if it is within 150 positions, more
+    # likely the closer it is
+    likelihood = {}
+    for tower in range(0, num_positions, 100):
+        likelihood[f'Tower {tower}'] = {
+            position: 1 - abs(position - tower) / 151
+            for position in range(max(0, tower - 150), min(num_positions, tower + 151))
+        }
+    
+    readings = ['Tower 41200', 'Tower 41300', 'Tower 41200', 'Tower 41300', 'Tower 41200']
+    updater = SparseBayesianUpdater(prior, likelihood, prune_below=1e-6)
+    for reading in readings:
+        updater.update(reading)
+        print(f"  after '{reading}': {len(updater.current_belief)} positions still possible")
+    
+    best = max(updater.current_belief, key=updater.current_belief.get)
+    print()
+    print(f"Most likely position: {best} (P = {updater.probability(best):.4f})")
+    low = min(updater.current_belief)
+    high = max(updater.current_belief)
+    print(f"Remaining range: {low} to {high}, pruned {updater.pruned} hypotheses "
+          f"carrying {updater.discarded_mass:.2e} of the mass")
+    
+    dense = BayesianUpdater(prior, likelihood)
+    for reading in readings:
+        dense.update(reading)
+    print(f"Same answer as the dense updater: P({best}) = {dense.current_belief[best]:.4f}")
+
+
+def simple_bayes_calculator():
+    """Simple interactive Bayes' Theorem calculator"""
+    print("\n=== BAYES' THEOREM CALCULATOR ===")
+    print("Formula: P(A|B) = P(B|A) * P(A) / P(B)")
+    print()
+    
+    try:
+        # Get user input
+        p_a = float(input("Enter P(A) [prior probability of A]: "))
+        p_b_given_a = float(input("Enter P(B|A) [probability of B given A]: "))
+        p_b_given_not_a = float(input("Enter P(B|not A) [probability of B given not A]: "))
+        
+        # Calculate P(B) = P(B|A)*P(A) + P(B|not A)*P(not A)
+        p_not_a = 1 - p_a
+        p_b = (p_b_given_a * p_a) + (p_b_given_not_a * p_not_a)
+        
+        # Calculate P(A|B) using Bayes' Theorem
+        p_a_given_b = (p_b_given_a * p_a) / p_b
+        
+        print("\nResults:")
+        print(f"P(B) = P(B|A)*P(A) + P(B|not A)*P(not A)")
+        print(f"     = ({p_b_given_a:.4f} * {p_a:.4f}) + ({p_b_given_not_a:.4f} * {p_not_a:.4f})")
+        print(f"     = {p_b:.4f}")
+        print()
+        print(f"P(A|B) = P(B|A) * P(A) / P(B)")
+        print(f"       = ({p_b_given_a:.4f} * {p_a:.4f}) / {p_b:.4f}")
+        print(f"       = {p_a_given_b:.4f} ({p_a_given_b*100:.1f}%)")
+        
+    except ValueError:
+        print("Please enter valid numbers between 0 and 1")
+    except ZeroDivisionError:
+        print("Cannot divide by zero. Check your inputs.")
+
+
+def main():
+    medical_diagnosis_example()
+    print("\n" + "="*60 + "\n")
+    spam_filter_example()
+    print("\n" + "="*60 + "\n")
+    coin_bias_example()
+    print("\n" + "="*60 + "\n")
+    test_policy_grid_example()
+    print("\n" + "="*60 + "\n")
+    sparse_location_example()
+    print("\n" + "="*60 + "\n")
+    simple_bayes_calculator()
+    
+    print("\n=== BAYESIAN UPDATING SUMMARY ===")
+    print("Key concepts implemented:")
+    print("1. Bayes' Theorem: P(H|E) = P(E|H) * P(H) / P(E)")
+    print("2. Prior: Initial beliefs before evidence")
+    print("3. Likelihood: Probability of evidence given hypothesis")
+    print("4. Posterior: Updated beliefs after evidence")
+    print("5. Sequential updating: Incorporating multiple pieces of evidence")
+
+
+if __name__ == "__main__":
+    main()
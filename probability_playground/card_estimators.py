@@ -0,0 +1,244 @@
+from .card_simulations import SimpleRandom, create_deck, simulate_draws, theoretical_probability
+
+# Every estimator returns (estimate, standard_error). The variance reduced
+# ones aim for the same standard error as plain counting with far fewer
+# simulated draws.
+
+HANDS_OF_FIVE = 2598960           # 52 choose 5
+FOUR_OF_A_KIND_HANDS = 13 * 48    # pick the rank, then any fifth card
+
+
+def _mean_and_standard_error(values):
+    n = len(values)
+    if n == 0:
+        return 0.0, 0.0
+    mean = sum(values) / n
+    if n == 1:
+        return mean, 0.0
+    variance = sum((v - mean) ** 2 for v in values) / (n - 1)
+    return mean, (variance / n) ** 0.5
+
+
+def plain_estimate(sample, condition, num_samples, random_gen=None):
+    """
+    Ordinary Monte Carlo: fraction of samples that meet the condition
+    
+    Parameters:
+    sample: function random_gen -> one simulated outcome (e.g. a hand)
+    condition: function outcome -> True/False
+    num_samples: number of outcomes to simulate
+    """
+    random_gen = random_gen or SimpleRandom()
+    hits = [1.0 if condition(sample(random_gen)) else 0.0 for _ in range(num_samples)]
+    return _mean_and_standard_error(hits)
+
+
+def _mirror_position(i, deck_size):
+    return deck_size - 1 - i
+
+
+def antithetic_estimate(deck, condition, num_pairs, random_gen=None, partner=None):
+    """
+    Single-card draws in antithetic pairs: position i and partner(i)
+    
+    The pair average only varies less than two independent draws when the
+    partner card tends to disagree with the first on the condition. The
+    default partner, position n-1-i, does that for suit conditions because
+    create_deck groups the suits; on a shuffled deck it gives no gain.
+    
+    Parameters:
+    deck: list of cards
+    condition: function card -> True/False
+    num_pairs: number of pairs to draw
+    partner: function (i, deck_size) -> index of the card paired with
+        position i; it must be a one-to-one mapping of the positions so
+        the estimate stays unbiased (default: n-1-i)
+    """
+    random_gen = random_gen or SimpleRandom()
+    partner = partner or _mirror_position
+    size = len(deck)
+    pair_means = []
+    for _ in range(num_pairs):
+        i = random_gen.randint(0, size - 1)
+        hits = (1.0 if condition(deck[i]) else 0.0) + (1.0 if condition(deck[partner(i, size)]) else 0.0)
+        pair_means.append(hits / 2)
+    return _mean_and_standard_error(pair_means)
+
+
+def control_variate_estimate(sample, condition, control, control_mean, num_samples, random_gen=None):
+    """
+    Plain counting corrected by a related quantity whose exact mean is known
+    
+    estimate = mean(Y) - beta * (mean(C) - E[C]), with beta = cov(Y, C) / var(C)
+    estimated from the same samples.
+    
+    Parameters:
+    sample, condition: as for plain_estimate (Y = condition(outcome))
+    control: function outcome -> True/False (or a number) with known mean
+    control_mean: the exact E[C], e.g. from theoretical_probability
+    """
+    random_gen = random_gen or SimpleRandom()
+    ys, cs = [], []
+    for _ in range(num_samples):
+        outcome = sample(random_gen)
+        ys.append(float(condition(outcome)))
+        cs.append(float(control(outcome)))
+    
+    n = len(ys)
+    mean_y = sum(ys) / n
+    mean_c = sum(cs) / n
+    var_c = sum((c - mean_c) ** 2 for c in cs)
+    cov = sum((y - mean_y) * (c - mean_c) for y, c in zip(ys, cs))
+    beta = cov / var_c if var_c else 0.0
+    adjusted = [y - beta * (c - control_mean) for y, c in zip(ys, cs)]
+    return _mean_and_standard_error(adjusted)
+
+
+def stratified_estimate(strata, num_samples, random_gen=None):
+    """
+    Sample each stratum separately and combine with the stratum weights
+    
+    Parameters:
+    strata: list of (weight, sample, condition); weights are the stratum
+        probabilities and must sum to 1
+    num_samples: total samples, split in proportion to the weights
+    """
+    random_gen = random_gen or SimpleRandom()
+    estimate = 0.0
+    variance = 0.0
+    for weight, sample, condition in strata:
+        n = max(2, round(weight * num_samples))
+        mean, standard_error = plain_estimate(sample, condition, n, random_gen)
+        estimate += weight * mean
+        variance += (weight * standard_error) ** 2
+    return estimate, variance ** 0.5
+
+
+def first_card_suit_strata(deck, condition):
+    """
+    Strata for two-card draws without replacement, one per suit of the
+    first card. Each stratum draws its first card from that suit only.
+    """
+    strata = []
+    for suit in ['H', 'D', 'C', 'S']:
+        suit_cards = [card for card in deck if card.endswith(suit)]
+        
+        def sample(random_gen, suit_cards=suit_cards):
+            first = suit_cards[random_gen.randint(0, len(suit_cards) - 1)]
+            rest = [card for card in deck if card != first]
+            return [first, rest[random_gen.randint(0, len(rest) - 1)]]
+        
+        strata.append((len(suit_cards) / len(deck), sample, condition))
+    return strata
+
+
+def is_four_of_a_kind(hand):
+    ranks = [card[:-1] for card in hand]
+    return any(ranks.count(rank) == 4 for rank in set(ranks))
+
+
+def importance_four_of_a_kind(num_samples, random_gen=None, mix=0.5):
+    """
+    P(four of a kind in 5 cards) by importance sampling
+    
+    Plain counting almost never sees the event (about 1 hand in 4165).
+    Here, with probability `mix`, a hand is dealt that is guaranteed to be
+    four of a kind; otherwise an ordinary random hand. Each hand is weighted
+    by P(hand) / Q(hand), which keeps the estimate unbiased.
+    """
+    random_gen = random_gen or SimpleRandom()
+    deck = create_deck()
+    ranks = sorted({card[:-1] for card in deck})
+    threshold = int(mix * 1000000)
+    
+    p_hand = 1 / HANDS_OF_FIVE
+    q_quads = mix / FOUR_OF_A_KIND_HANDS + (1 - mix) * p_hand
+    
+    weights = []
+    for _ in range(num_samples):
+        if random_gen.randint(0, 999999) < threshold:
+            rank = ranks[random_gen.randint(0, len(ranks) - 1)]
+            others = [card for card in deck if card[:-1] != rank]
+            hand = [card for card in deck if card[:-1] == rank]
+            hand.append(others[random_gen.randint(0, len(others) - 1)])
+        else:
+            hand = simulate_draws(deck, 5, with_replacement=False, random_gen=random_gen)
+        # Only four-of-a-kind hands count, and they all have the same weight
+        weights.append(p_hand / q_quads if is_four_of_a_kind(hand) else 0.0)
+    return _mean_and_standard_error(weights)
+
+
+# ==================== DEMONSTRATION ====================
+def _show(label, result, exact, plain_samples_needed=None):
+    estimate, standard_error = result
+    line = f"   {label:24s} {estimate:.5f} ± {standard_error:.5f}  (exact {exact:.5f})"
+    if plain_samples_needed is not None:
+        line += f"  ~ plain counting with {plain_samples_needed:,} samples"
+    print(line)
+
+
+def _plain_equivalent(exact, standard_error):
+    """Samples plain counting needs to reach the same standard error"""
+    if standard_error == 0:
+        return None
+    return round(exact * (1 - exact) / standard_error ** 2)
+
+
+def run_estimator_demonstrations():
+    print("=== VARIANCE-REDUCED CARD SIMULATION ===")
+    print("estimate ± standard error")
+    print()
+    
+    deck = create_deck()
+    
+    def one_card(random_gen):
+        return deck[random_gen.randint(0, len(deck) - 1)]
+    
+    def two_cards(random_gen):
+        return simulate_draws(deck, 2, with_replacement=False, random_gen=random_gen)
+    
+    def is_heart(card):
+        return card.endswith('H')
+    
+    def same_suit(hand):
+        return hand[0][-1] == hand[1][-1]
+    
+    def same_colour(hand):
+        return (hand[0][-1] in 'HD') == (hand[1][-1] in 'HD')
+    
+    n = 2000
+    p_heart = theoretical_probability(13, 52, 1, True)
+    print(f"1. P(Heart), {n} draws:")
+    _show("plain", plain_estimate(one_card, is_heart, n, SimpleRandom(1)), p_heart)
+    # The default n-1-i pairing only helps while create_deck groups the suits
+    if all(deck[i][-1] != deck[-1 - i][-1] for i in range(len(deck))):
+        result = antithetic_estimate(deck, is_heart, n // 2, SimpleRandom(1))
+        _show("antithetic", result, p_heart, _plain_equivalent(p_heart, result[1]))
+    else:
+        print("   antithetic: skipped, deck order pairs cards of the same suit")
+    print()
+    
+    p_same = (13/52) * (12/51) * 4
+    p_colour = 25 / 51
+    print(f"2. P(two cards same suit), {n} draws:")
+    _show("plain", plain_estimate(two_cards, same_suit, n, SimpleRandom(2)), p_same)
+    result = control_variate_estimate(two_cards, same_suit, same_colour, p_colour, n, SimpleRandom(2))
+    _show("control variate (colour)", result, p_same, _plain_equivalent(p_same, result[1]))
+    result = stratified_estimate(first_card_suit_strata(deck, same_suit), n, SimpleRandom(2))
+    _show("stratified (first suit)", result, p_same, _plain_equivalent(p_same, result[1]))
+    print()
+    
+    p_quads = FOUR_OF_A_KIND_HANDS / HANDS_OF_FIVE
+    print(f"3. P(four of a kind), {n} hands:")
+    _show("plain", plain_estimate(lambda g: simulate_draws(deck, 5, False, g),
+                                  is_four_of_a_kind, n, SimpleRandom(3)), p_quads)
+    result = importance_four_of_a_kind(n, SimpleRandom(3))
+    _show("importance sampling", result, p_quads, _plain_equivalent(p_quads, result[1]))
+
+
+def main():
+    run_estimator_demonstrations()
+
+
+if __name__ == "__main__":
+    main()
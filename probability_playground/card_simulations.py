@@ -1,5 +1,9 @@
 # ==================== PURE PYTHON - NO IMPORTS ====================
 
+# Optional instrumentation (set by instrumentation.enable). While it is
+# None the only cost is one check per function call.
+_probe = None
+
 # Simple random number generator (linear congruential generator)
 class SimpleRandom:
     def __init__(self, seed=None):
@@ -14,6 +18,11 @@ class SimpleRandom:
         rand_num = self.state / self.m  # Between 0 and 1
         return a + int(rand_num * (b - a + 1))
     
+    def random(self):
+        """Generate random float between 0 (inclusive) and 1 (exclusive)"""
+        self.state = (self.a * self.state + self.c) % self.m
+        return self.state / self.m
+    
     def choice(self, items):
         """Randomly choose one item from list"""
         if not items:
@@ -117,6 +126,10 @@ def simulate_draws(deck, num_draws, with_replacement=True, random_gen=None):
     if random_gen is None:
         random_gen = SimpleRandom()
     
+    probe = _probe
+    if probe is not None:
+        started = probe.clock()
+    
     working_deck = deck.copy()
     draws = []
     
@@ -133,19 +146,146 @@ def simulate_draws(deck, num_draws, with_replacement=True, random_gen=None):
             # Remove the card
             working_deck.pop(index)
     
+    if probe is not None:
+        probe.record('simulate_draws', probe.clock() - started)
+        probe.count('draws', len(draws))
+        probe.count('random_numbers', len(draws))  # one SimpleRandom.randint per draw
+    
     return draws
 
 
+class Shoe:
+    """
+    A shoe of num_decks decks, dealt down to a cut card and reshuffled.
+    
+    The cards stay in one list for the life of the shoe: dealing moves a
+    position forward and reshuffling permutes the list in place, so
+    nothing is copied or reallocated between rounds. The shoe also keeps
+    how many cards of each kind, rank and suit are still undealt, which
+    makes "what is the next card likely to be" an O(1) question.
+    """
+    
+    TEN_VALUE = ('10', 'J', 'Q', 'K')
+    
+    def __init__(self, num_decks=6, penetration=0.75, random_gen=None):
+        """
+        Parameters:
+        num_decks: number of 52-card decks in the shoe
+        penetration: fraction of the shoe dealt before the cut card
+        random_gen: SimpleRandom used for shuffling
+        """
+        if num_decks < 1:
+            raise ValueError("num_decks must be at least 1")
+        if not 0 < penetration <= 1:
+            raise ValueError("penetration must be between 0 and 1")
+        self.num_decks = num_decks
+        self.cards = create_deck() * num_decks
+        self.cut_card = int(len(self.cards) * penetration)
+        self.random_gen = random_gen or SimpleRandom()
+        
+        self.full_card_counts = {}
+        self.full_rank_counts = {}
+        self.full_suit_counts = {}
+        for card in self.cards:
+            self.full_card_counts[card] = self.full_card_counts.get(card, 0) + 1
+            self.full_rank_counts[card[:-1]] = self.full_rank_counts.get(card[:-1], 0) + 1
+            self.full_suit_counts[card[-1]] = self.full_suit_counts.get(card[-1], 0) + 1
+        self.card_counts = dict(self.full_card_counts)
+        self.rank_counts = dict(self.full_rank_counts)
+        self.suit_counts = dict(self.full_suit_counts)
+        self.position = 0
+        self.shuffles = 0
+        self.shuffle()
+    
+    def shuffle(self):
+        """Put every card back and shuffle in place (Fisher-Yates)"""
+        probe = _probe
+        if probe is not None:
+            started = probe.clock()
+        
+        cards = self.cards
+        randint = self.random_gen.randint
+        for i in range(len(cards) - 1, 0, -1):
+            j = randint(0, i)
+            cards[i], cards[j] = cards[j], cards[i]
+        self.card_counts.update(self.full_card_counts)
+        self.rank_counts.update(self.full_rank_counts)
+        self.suit_counts.update(self.full_suit_counts)
+        self.position = 0
+        self.shuffles += 1
+        
+        if probe is not None:
+            probe.record('shoe_shuffle', probe.clock() - started)
+            probe.count('random_numbers', len(cards) - 1)
+    
+    def needs_shuffle(self):
+        """True once the cut card has come out"""
+        return self.position >= self.cut_card
+    
+    def deal(self):
+        """Deal the next card"""
+        if self.position == len(self.cards):
+            raise ValueError("The shoe is empty; call shuffle()")
+        card = self.cards[self.position]
+        self.position += 1
+        self.card_counts[card] -= 1
+        self.rank_counts[card[:-1]] -= 1
+        self.suit_counts[card[-1]] -= 1
+        return card
+    
+    def deal_many(self, num_cards):
+        return [self.deal() for _ in range(num_cards)]
+    
+    def cards_left(self):
+        return len(self.cards) - self.position
+    
+    def probability_next(self, rank=None, suit=None):
+        """
+        P(next card has this rank / suit | cards dealt so far)
+        
+        Give a rank, a suit, or both (e.g. rank='A', suit='S').
+        """
+        left = self.cards_left()
+        if left == 0:
+            return 0.0
+        if rank is not None and suit is not None:
+            return self.card_counts.get(rank + suit, 0) / left
+        if rank is not None:
+            return self.rank_counts.get(rank, 0) / left
+        if suit is not None:
+            return self.suit_counts.get(suit, 0) / left
+        raise ValueError("Give a rank and/or a suit")
+    
+    def probability_next_in(self, ranks):
+        """P(next card's rank is one of ranks | cards dealt so far)"""
+        left = self.cards_left()
+        if left == 0:
+            return 0.0
+        return sum(self.rank_counts.get(rank, 0) for rank in ranks) / left
+    
+    def ten_value_probability(self):
+        """P(next card is a 10, J, Q or K | cards dealt so far)"""
+        return self.probability_next_in(self.TEN_VALUE)
+
+
 def experimental_probability(draws, condition_func):
     """Calculate probability from simulation results"""
     if not draws:
         return 0.0
     
+    probe = _probe
+    if probe is not None:
+        started = probe.clock()
+    
     favorable = 0
     for card in draws:
         if condition_func(card):
             favorable += 1
     
+    if probe is not None:
+        probe.record('experimental_probability', probe.clock() - started)
+        probe.count('outcomes_evaluated', len(draws))
+    
     return favorable / len(draws)
 
 
@@ -352,15 +492,48 @@ def simple_dice_game():
     print()
 
 
-# Run everything
-if __name__ == "__main__":
+def shoe_example():
+    """Six-deck shoe dealt to 75% penetration"""
+    print("=== SIX-DECK SHOE ===")
+    shoe = Shoe(num_decks=6, penetration=0.75, random_gen=SimpleRandom(seed=21))
+    print(f"{len(shoe.cards)} cards, cut card after {shoe.cut_card}")
+    print(f"P(first card is ten-value) = {shoe.ten_value_probability():.4f} (16/52 = {16/52:.4f})")
+    print()
+    
+    # Deal each shoe down to the cut card, and compare the predicted
+    # P(next card is ten-value) with how often it actually was
+    high, high_hits, low, low_hits = 0, 0, 0, 0
+    for _ in range(2000):
+        while not shoe.needs_shuffle():
+            p_ten = shoe.ten_value_probability()
+            is_ten = shoe.deal()[:-1] in Shoe.TEN_VALUE
+            if p_ten > 0.33:
+                high += 1
+                high_hits += is_ten
+            elif p_ten < 0.29:
+                low += 1
+                low_hits += is_ten
+        shoe.shuffle()
+    
+    print(f"Dealt {shoe.shuffles - 1} shoes.")
+    print(f"When P(ten) > 0.33 was predicted: next card was ten-value {high_hits / high:.4f} of {high} times")
+    print(f"When P(ten) < 0.29 was predicted: next card was ten-value {low_hits / low:.4f} of {low} times")
+    print()
+
+
+def main():
     run_demonstrations()
     student_survey_example()
     simple_dice_game()
+    shoe_example()
     
     print("=== SUMMARY ===")
     print("✓ All code uses pure Python (no imports)")
     print("✓ Implements all probability concepts mathematically")
     print("✓ Includes our own random number generator")
     print("✓ Shows theory → code translation")
-    print("✓ Practical examples with calculations")
\ No newline at end of file
+    print("✓ Practical examples with calculations")
+
+
+if __name__ == "__main__":
+    main()
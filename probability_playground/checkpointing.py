@@ -0,0 +1,211 @@
+import os
+import pickle
+import tempfile
+import time
+
+from .card_simulations import SimpleRandom, create_deck, simulate_draws
+
+CHECKPOINT_VERSION = 1
+
+
+def draw_trial(deck, num_draws=1, with_replacement=True, key=None):
+    """
+    Make a trial function that draws cards with simulate_draws
+    
+    Parameters:
+    key: function draws -> outcome to count (default: the tuple of cards)
+    
+    Returns: function random_gen -> outcome
+    """
+    key = key or tuple
+    
+    def trial(random_gen):
+        return key(simulate_draws(deck, num_draws, with_replacement, random_gen))
+    return trial
+
+
+class CheckpointedRun:
+    """
+    A long simulation that can be interrupted and resumed.
+    
+    Every trial is trial(random_gen) -> outcome, and the run keeps a
+    frequency table of outcomes. Between trials the whole state is the
+    SimpleRandom state, the trial counter and that table, so saving it
+    and carrying on from the saved copy gives exactly the same result as a
+    run that was never stopped.
+    """
+    
+    def __init__(self, path, trial, num_trials, seed=None, every_seconds=60.0,
+                 every_trials=None, name='simulation'):
+        """
+        Parameters:
+        path: checkpoint file (written atomically)
+        trial: function random_gen -> hashable outcome
+        num_trials: total trials in the run
+        seed: SimpleRandom seed for a fresh start
+        every_seconds: save once this long has passed since the previous
+            save (checked between trials, see run)
+        every_trials: also save every this many trials (optional)
+        name: stored in the file; resuming under another name is refused
+        """
+        if every_seconds is None and every_trials is None:
+            raise ValueError("Give every_seconds and/or every_trials")
+        self.path = path
+        self.trial = trial
+        self.num_trials = num_trials
+        self.seed = seed
+        self.every_seconds = every_seconds
+        self.every_trials = every_trials
+        self.name = name
+        
+        self.random_gen = SimpleRandom(seed)
+        self.trials_done = 0
+        self.frequencies = {}
+        self.checkpoints_written = 0
+        self.resumed_from = None
+    
+    def save(self):
+        """Write the current state, replacing the old checkpoint atomically"""
+        state = {
+            'version': CHECKPOINT_VERSION,
+            'name': self.name,
+            'seed': self.seed,
+            'num_trials': self.num_trials,
+            'trials_done': self.trials_done,
+            'rng_state': self.random_gen.state,
+            'frequencies': self.frequencies,
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self.checkpoints_written += 1
+    
+    def load(self):
+        """
+        Restore the state from the checkpoint file
+        
+        Returns: True if a checkpoint was loaded, False if there is none
+        """
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, 'rb') as f:
+            state = pickle.load(f)
+        
+        if state.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {state.get('version')!r}")
+        for field in ('name', 'seed', 'num_trials'):
+            if state[field] != getattr(self, field):
+                raise ValueError(f"Checkpoint {self.path} was written with {field}={state[field]!r}, "
+                                 f"not {getattr(self, field)!r}")
+        
+        self.trials_done = state['trials_done']
+        self.random_gen.state = state['rng_state']
+        self.frequencies = state['frequencies']
+        self.resumed_from = self.trials_done
+        return True
+    
+    def run(self, resume=True, stop_after=None):
+        """
+        Run (or continue) the simulation
+        
+        The clock is read between blocks of trials. Block sizes come from
+        the measured time per trial so that a block takes about 1% of
+        every_seconds (at most 1024 trials, at least 1). A save is then
+        late by at most that 1% plus one trial, and reading the clock
+        costs next to nothing even when trials take microseconds.
+        
+        Parameters:
+        resume: continue from the checkpoint file if there is one
+        stop_after: stop (after saving) once this many trials were run in
+            this call, e.g. to test a resume
+        
+        Returns: dict of outcome frequencies (so far, if stopped early)
+        """
+        if resume:
+            self.load()
+        
+        trial = self.trial
+        random_gen = self.random_gen
+        frequencies = self.frequencies
+        end = self.num_trials
+        if stop_after is not None:
+            end = min(end, self.trials_done + stop_after)
+        
+        last_save = time.monotonic()
+        done = self.trials_done
+        block = 1  # grows once the time per trial is known
+        while done < end:
+            # Run up to the next point where a checkpoint may be due
+            block_end = min(end, done + block)
+            if self.every_trials:
+                block_end = min(block_end, (done // self.every_trials + 1) * self.every_trials)
+            started = time.monotonic()
+            for _ in range(block_end - done):
+                outcome = trial(random_gen)
+                frequencies[outcome] = frequencies.get(outcome, 0) + 1
+            now = time.monotonic()
+            per_trial = (now - started) / (block_end - done)
+            if self.every_seconds is None or per_trial == 0:
+                block = 1024
+            else:
+                block = max(1, min(1024, int(self.every_seconds / 100 / per_trial)))
+            done = block_end
+            
+            due = self.every_trials and done % self.every_trials == 0
+            if not due and self.every_seconds is not None:
+                due = now - last_save >= self.every_seconds
+            if due and done < end:
+                self.trials_done = done
+                self.save()
+                last_save = time.monotonic()
+        
+        self.trials_done = done
+        self.save()
+        return dict(frequencies)
+    
+    def finished(self):
+        return self.trials_done >= self.num_trials
+
+
+def checkpoint_example():
+    print("=== CHECKPOINT AND RESUME ===")
+    print()
+    deck = create_deck()
+    trial = draw_trial(deck, 2, with_replacement=False,
+                       key=lambda cards: cards[0][-1] == cards[1][-1])
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'same_suit.ckpt')
+        
+        print("1. Uninterrupted run of 50,000 trials:")
+        reference = CheckpointedRun(os.path.join(folder, 'reference.ckpt'), trial, 50000,
+                                    seed=42, every_trials=10000).run()
+        print(f"   same suit: {reference.get(True, 0)} times")
+        print()
+        
+        print("2. Same run, 'crashing' after 18,000 trials and again after 20,000 more:")
+        first = CheckpointedRun(path, trial, 50000, seed=42, every_trials=10000)
+        first.run(stop_after=18000)
+        print(f"   stopped at trial {first.trials_done}")
+        second = CheckpointedRun(path, trial, 50000, seed=42, every_trials=10000)
+        second.run(stop_after=20000)
+        print(f"   resumed at trial {second.resumed_from}, stopped at {second.trials_done}")
+        third = CheckpointedRun(path, trial, 50000, seed=42, every_trials=10000)
+        resumed = third.run()
+        print(f"   resumed at trial {third.resumed_from}, finished at {third.trials_done}")
+        print(f"   same suit: {resumed.get(True, 0)} times")
+        print(f"   identical to the uninterrupted run: {resumed == reference}")
+        print()
+        
+        print(f"P(two cards share a suit) = {resumed[True] / 50000:.4f}  (theory {12 / 51:.4f})")
+
+
+def main():
+    checkpoint_example()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+from fractions import Fraction
+
+from .card_simulations import create_deck
+
+
+def deck_counts(by='suit', num_decks=1):
+    """
+    Composition of a shoe of num_decks standard decks
+    
+    Parameters:
+    by: 'suit' (4 categories) or 'rank' (13 categories)
+    
+    Returns: (category names, counts) as two lists
+    """
+    if by == 'suit':
+        key = lambda card: card[-1]
+    elif by == 'rank':
+        key = lambda card: card[:-1]
+    else:
+        raise ValueError("by must be 'suit' or 'rank'")
+    
+    counts = {}
+    for card in create_deck():
+        counts[key(card)] = counts.get(key(card), 0) + num_decks
+    return list(counts), list(counts.values())
+
+
+class DeckComposition:
+    """
+    Exact probabilities for sequential draws without replacement.
+    
+    The remaining deck is described only by how many cards of each
+    category are left. Draw by draw we keep the probability of every
+    reachable composition (for which the event hasn't happened yet);
+    compositions reached along different paths are merged, so the work
+    depends on the number of distinct compositions, not on the number of
+    draw orders. For 52 cards by suit that is at most 14^4 states.
+    """
+    
+    def __init__(self, counts, exact=False):
+        """
+        Parameters:
+        counts: list of card counts per category, e.g. [13, 13, 13, 13]
+        exact: if True, work with fractions.Fraction instead of floats
+        """
+        self.counts = tuple(counts)
+        self.exact = exact
+    
+    def success_by_draw(self, num_draws, is_success, symmetric=False):
+        """
+        P(the event has happened by draw k) for k = 1 .. num_draws
+        
+        Parameters:
+        num_draws: how many cards are drawn at most
+        is_success: function drawn_counts -> True/False, where drawn_counts
+            is a tuple of how many cards of each category have been drawn.
+            Once it is True the event counts as having happened.
+        symmetric: set True if is_success doesn't care which category is
+            which (e.g. "all four suits seen"); categories are then sorted
+            so equivalent compositions share one state
+        
+        Returns: list of num_draws cumulative probabilities
+        """
+        one = Fraction(1) if self.exact else 1.0
+        initial = self.counts
+        
+        if symmetric:
+            # State = sorted (initial, remaining) pairs
+            def key_of(remaining_pairs):
+                return tuple(sorted(remaining_pairs))
+            start = key_of(zip(initial, initial))
+        else:
+            start = initial
+        
+        level = {start: one}
+        cumulative = []
+        total_success = 0 * one
+        
+        for draw in range(num_draws):
+            left_in_deck = sum(initial) - draw
+            next_level = {}
+            if left_in_deck > 0:
+                for state, p_state in level.items():
+                    if symmetric:
+                        firsts = [pair[0] for pair in state]
+                        remaining = [pair[1] for pair in state]
+                    else:
+                        firsts = initial
+                        remaining = state
+                    for i, left in enumerate(remaining):
+                        if left == 0:
+                            continue
+                        p = p_state * left / left_in_deck
+                        after = list(remaining)
+                        after[i] -= 1
+                        drawn = tuple(f - a for f, a in zip(firsts, after))
+                        if is_success(drawn):
+                            total_success += p
+                        else:
+                            key = key_of(zip(firsts, after)) if symmetric else tuple(after)
+                            next_level[key] = next_level.get(key, 0 * one) + p
+            level = next_level
+            cumulative.append(total_success)
+        
+        return cumulative
+    
+    def probability(self, num_draws, is_success, symmetric=False):
+        """P(the event has happened within num_draws draws)"""
+        if num_draws == 0:
+            return Fraction(0) if self.exact else 0.0
+        return self.success_by_draw(num_draws, is_success, symmetric)[-1]
+    
+    def probability_at_least(self, required, num_draws):
+        """
+        P(within num_draws draws, at least required[i] cards of category i
+        have been drawn, for every i)
+        
+        Parameters:
+        required: list of minimum counts per category (0 = don't care)
+        """
+        required = tuple(required)
+        return self.probability(
+            num_draws, lambda drawn: all(d >= r for d, r in zip(drawn, required)))
+
+
+def first_ace_by_draw(num_draws, num_decks=1, exact=False):
+    """P(the first Ace has appeared by draw k), for k = 1 .. num_draws"""
+    aces = 4 * num_decks
+    deck = DeckComposition([aces, 52 * num_decks - aces], exact)
+    return deck.success_by_draw(num_draws, lambda drawn: drawn[0] >= 1)
+
+
+def all_suits_within(num_draws, num_decks=1, exact=False):
+    """P(all four suits have appeared within num_draws cards)"""
+    _, counts = deck_counts('suit', num_decks)
+    deck = DeckComposition(counts, exact)
+    return deck.probability(num_draws, lambda drawn: all(drawn), symmetric=True)
+
+
+def sequential_draw_examples():
+    print("=== EXACT SEQUENTIAL DRAW PROBABILITIES ===")
+    print("(deck composition dynamic programming, no simulation)")
+    print()
+    
+    print("1. P(first Ace has appeared by draw k), one deck:")
+    by_draw = first_ace_by_draw(20)
+    for k in (1, 5, 10, 13, 20):
+        print(f"   k = {k:2d}: {by_draw[k - 1]:.4f}")
+    print()
+    
+    print("2. P(all four suits within n cards):")
+    for n in (4, 6, 8, 10):
+        exact = all_suits_within(n, exact=True)
+        print(f"   n = {n:2d}: {float(exact):.4f}  (exactly {exact})")
+    print()
+    
+    print("3. Six-deck shoe:")
+    print(f"   P(all four suits within 6 cards) = {all_suits_within(6, num_decks=6):.4f}")
+    names, counts = deck_counts('rank', num_decks=6)
+    tens = [1 if name in ('10', 'J', 'Q', 'K') else 0 for name in names]
+    shoe = DeckComposition([sum(c for c, t in zip(counts, tens) if t),
+                            sum(c for c, t in zip(counts, tens) if not t)])
+    print(f"   P(at least 3 ten-value cards in the first 5) = {shoe.probability_at_least([3, 0], 5):.4f}")
+
+
+def main():
+    sequential_draw_examples()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+from itertools import combinations, combinations_with_replacement
+
+from .card_simulations import SimpleRandom, create_deck, simulate_draws
+
+# Cards are encoded as one int (the "Cactus Kev" layout):
+#   bits 16-28: one bit for the rank
+#   bits 12-15: one bit for the suit
+#   bits  8-11: rank number (0 = deuce ... 12 = ace)
+#   bits  0-7 : a prime for the rank
+# so a 5-card hand can be classified with a few bit operations and one
+# table lookup:
+#   - all five share a suit bit      -> flush table, indexed by OR of rank bits
+#   - five different rank bits       -> distinct-ranks table, same index
+#   - otherwise (some rank repeats)  -> table indexed by product of primes,
+#                                       which is unique per rank multiset
+
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+SUITS = ['H', 'D', 'C', 'S']
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+CATEGORIES = ['High Card', 'One Pair', 'Two Pair', 'Three of a Kind', 'Straight',
+              'Flush', 'Full House', 'Four of a Kind', 'Straight Flush']
+
+# Exact number of 5-card hands in each category
+FIVE_CARD_COUNTS = {
+    'High Card': 1302540, 'One Pair': 1098240, 'Two Pair': 123552,
+    'Three of a Kind': 54912, 'Straight': 10200, 'Flush': 5108,
+    'Full House': 3744, 'Four of a Kind': 624, 'Straight Flush': 40,
+}
+
+_CATEGORY_SHIFT = 20
+_tables = None
+
+
+def encode_card(card):
+    """'AH' -> encoded int (see the layout above)"""
+    rank = RANKS.index(card[:-1])
+    suit = SUITS.index(card[-1])
+    return (1 << (16 + rank)) | (1 << (12 + suit)) | (rank << 8) | PRIMES[rank]
+
+
+def encode_hand(cards):
+    return [encode_card(card) for card in cards]
+
+
+def _score(category, ranks):
+    """Higher score = better hand; ties broken by ranks, most important first"""
+    score = category
+    for i in range(5):
+        score = (score << 4) | (ranks[i] + 1 if i < len(ranks) else 0)
+    return score
+
+
+def _build_tables():
+    flush = [0] * 8192      # OR of rank bits -> score if all one suit
+    distinct = [0] * 8192   # OR of rank bits -> score for five different ranks
+    products = {}           # product of primes -> score when a rank repeats
+    
+    straights = {}
+    for top in range(12, 3, -1):
+        straights[sum(1 << r for r in range(top - 4, top + 1))] = top
+    straights[(1 << 12) | 0b1111] = 3  # A-2-3-4-5, five high
+    
+    for ranks in combinations(range(12, -1, -1), 5):
+        bits = sum(1 << r for r in ranks)
+        if bits in straights:
+            flush[bits] = _score(CATEGORIES.index('Straight Flush'), [straights[bits]])
+            distinct[bits] = _score(CATEGORIES.index('Straight'), [straights[bits]])
+        else:
+            flush[bits] = _score(CATEGORIES.index('Flush'), list(ranks))
+            distinct[bits] = _score(CATEGORIES.index('High Card'), list(ranks))
+    
+    shapes = {
+        (4, 1): 'Four of a Kind', (3, 2): 'Full House', (3, 1, 1): 'Three of a Kind',
+        (2, 2, 1): 'Two Pair', (2, 1, 1, 1): 'One Pair',
+    }
+    for ranks in combinations_with_replacement(range(13), 5):
+        counts = {}
+        for r in ranks:
+            counts[r] = counts.get(r, 0) + 1
+        shape = tuple(sorted(counts.values(), reverse=True))
+        if shape not in shapes:
+            continue  # five different ranks, or five of one rank
+        ordered = sorted(counts, key=lambda r: (counts[r], r), reverse=True)
+        product = 1
+        for r in ranks:
+            product *= PRIMES[r]
+        products[product] = _score(CATEGORIES.index(shapes[shape]), ordered)
+    
+    return flush, distinct, products
+
+
+def _get_tables():
+    global _tables
+    if _tables is None:
+        _tables = _build_tables()
+    return _tables
+
+
+def evaluate5(c1, c2, c3, c4, c5):
+    """Score of a 5-card hand of encoded cards (higher is better)"""
+    flush, distinct, products = _tables or _get_tables()
+    rank_bits = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return flush[rank_bits]
+    score = distinct[rank_bits]
+    if score:
+        return score
+    return products[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+def evaluate(hand):
+    """
+    Score of the best 5-card hand within 5 to 7 encoded cards
+    
+    Compare scores with < and >; use hand_category for the name.
+    """
+    if len(hand) == 5:
+        return evaluate5(*hand)
+    if not 5 < len(hand) <= 7:
+        raise ValueError("A hand must have 5 to 7 cards")
+    return max(evaluate5(*five) for five in combinations(hand, 5))
+
+
+def hand_category(score):
+    """Name of the category of a score, e.g. 'Full House'"""
+    return CATEGORIES[score >> _CATEGORY_SHIFT]
+
+
+def evaluate_batch(hands):
+    """Scores for a list of hands (each a list of 5 to 7 encoded cards)"""
+    _get_tables()
+    if all(len(hand) == 5 for hand in hands):
+        return [evaluate5(*hand) for hand in hands]
+    return [evaluate(hand) for hand in hands]
+
+
+def category_counts(hands):
+    """How many hands fall in each category"""
+    counts = {name: 0 for name in CATEGORIES}
+    for score in evaluate_batch(hands):
+        counts[CATEGORIES[score >> _CATEGORY_SHIFT]] += 1
+    return counts
+
+
+def deal_hands(num_hands, cards_per_hand=5, random_gen=None):
+    """Deal encoded hands with simulate_draws (each from a fresh deck)"""
+    random_gen = random_gen or SimpleRandom()
+    deck = create_deck()
+    encoded = dict(zip(deck, encode_hand(deck)))
+    return [[encoded[card] for card in simulate_draws(deck, cards_per_hand, False, random_gen)]
+            for _ in range(num_hands)]
+
+
+def poker_hand_demonstration():
+    print("=== POKER HAND SIMULATION ===")
+    num_hands = 100000
+    hands = deal_hands(num_hands, 5, SimpleRandom(seed=2024))
+    counts = category_counts(hands)
+    
+    print(f"{num_hands:,} simulated 5-card hands:")
+    print(f"   {'Hand':16s} {'Simulated':>10s} {'Exact':>10s}")
+    for name in reversed(CATEGORIES):
+        exact = FIVE_CARD_COUNTS[name] / 2598960
+        print(f"   {name:16s} {counts[name] / num_hands:10.5f} {exact:10.5f}")
+    print()
+    
+    board = encode_hand(['AH', 'KH', '7D', '7C', '2S'])
+    for hole in (['AD', 'AS'], ['QH', 'JH'], ['7S', '8S']):
+        score = evaluate(encode_hand(hole) + board)
+        print(f"   {' '.join(hole)} + A K 7 7 2 -> {hand_category(score)}")
+
+
+def main():
+    poker_hand_demonstration()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+from math import inf, log
+
+from .bayesian_updating import BayesianUpdater
+
+
+class HiddenMarkovFilter(BayesianUpdater):
+    """
+    Bayesian updating for a hypothesis that can change between observations.
+    
+    Between two observations the belief is pushed through the transition
+    probabilities (predict), then updated with the new evidence exactly like
+    BayesianUpdater.update. The prior is the belief at the time of the first
+    observation.
+    
+    update, update_many, update_until and posterior_for all include the
+    predict step, so the filter can be used anywhere a BayesianUpdater is
+    expected.
+    
+    Internally beliefs are lists indexed like self.states, and each
+    transition row only stores its non-zero entries, so a step costs one
+    pass over the non-zero transitions.
+    """
+    
+    def __init__(self, prior, likelihood, transition):
+        """
+        Parameters:
+        prior: dict of hypotheses (states) and their probabilities
+        likelihood: dict of P(evidence|state), as for BayesianUpdater
+        transition: dict of dicts, transition[a][b] = P(next state b | state a);
+            every state of the prior needs a row, and each row must sum to 1
+        """
+        super().__init__(prior, likelihood)
+        self.transition = {state: row.copy() for state, row in transition.items()}
+        self.states = list(prior)
+        self._index = {state: i for i, state in enumerate(self.states)}
+        self._check_transition()
+        
+        self._rows = []
+        for state in self.states:
+            row = self.transition.get(state, {})
+            self._rows.append([(self._index[b], p) for b, p in row.items() if p != 0])
+        self._log_rows = [[(j, log(p)) for j, p in row] for row in self._rows]
+        self._emission_cache = {}
+        
+        self.observations_seen = 0
+        self.log_likelihood = 0.0  # log P(all evidence seen so far)
+    
+    def _check_transition(self, tolerance=1e-9):
+        """Raise ValueError for rows or states that don't match the prior"""
+        for state, row in self.transition.items():
+            if state not in self._index:
+                raise ValueError(f"Transition row {state!r} is not a state of the prior")
+            for next_state, p in row.items():
+                if next_state not in self._index:
+                    raise ValueError(f"Transition row {state!r} goes to {next_state!r}, "
+                                     f"which is not a state of the prior")
+                if p < 0:
+                    raise ValueError(f"Transition row {state!r} has a negative probability")
+            total = sum(row.values())
+            if abs(total - 1) > tolerance:
+                raise ValueError(f"Transition row {state!r} sums to {total}, not 1")
+        for state in self.states:
+            if state not in self.transition:
+                raise ValueError(f"State {state!r} has no transition row")
+    
+    # ---------- vector helpers ----------
+    def _emissions(self, evidence):
+        """P(evidence | state) for every state, as a list"""
+        column = self._emission_cache.get(evidence)
+        if column is None:
+            table = self.likelihood.get(evidence, {})
+            column = [table.get(state, 0) for state in self.states]
+            self._emission_cache[evidence] = column
+        return column
+    
+    def _predict_vector(self, belief):
+        """Transition-matrix times belief vector, skipping zero entries"""
+        predicted = [0.0] * len(belief)
+        for i, p_i in enumerate(belief):
+            if p_i:
+                for j, p_ij in self._rows[i]:
+                    predicted[j] += p_i * p_ij
+        return predicted
+    
+    def _update_vector(self, belief, evidence):
+        """Returns (normalized posterior, P(evidence)) for one observation"""
+        weighted = [p * e for p, e in zip(belief, self._emissions(evidence))]
+        total = sum(weighted)
+        if total == 0:
+            return weighted, 0.0
+        return [p / total for p in weighted], total
+    
+    def _to_dict(self, vector):
+        return dict(zip(self.states, vector))
+    
+    def _prior_vector(self):
+        return [self.prior[state] for state in self.states]
+    
+    # ---------- online filtering ----------
+    def predict(self):
+        """Move the current belief one time step forward"""
+        vector = [self.current_belief.get(state, 0) for state in self.states]
+        self.current_belief = self._to_dict(self._predict_vector(vector))
+        return self.current_belief.copy()
+    
+    def observe(self, evidence_observed):
+        """
+        Predict (except before the first observation), then update
+        
+        Returns the filtered belief P(state now | all evidence so far).
+        """
+        vector = [self.current_belief.get(state, 0) for state in self.states]
+        if self.observations_seen > 0:
+            vector = self._predict_vector(vector)
+        vector, p_evidence = self._update_vector(vector, evidence_observed)
+        self.log_likelihood += log(p_evidence) if p_evidence > 0 else -inf
+        self.observations_seen += 1
+        self.current_belief = self._to_dict(vector)
+        return self.current_belief.copy()
+    
+    def update(self, evidence_observed):
+        """Same as observe: the state may have moved since the last update"""
+        return self.observe(evidence_observed)
+    
+    def update_many(self, evidence_list):
+        """
+        Observe each item in order
+        
+        Unlike BayesianUpdater.update_many the order matters, so the
+        evidence is not collapsed into counts.
+        """
+        for evidence in evidence_list:
+            self.observe(evidence)
+        return self.current_belief.copy()
+    
+    def posterior_for(self, evidence_sequence):
+        """
+        Filtered belief after evidence_sequence, starting from the prior
+        
+        Runs the forward pass; current_belief is not changed. Nothing is
+        cached, because the result depends on the order of the evidence.
+        """
+        filtered, _ = self._forward(list(evidence_sequence))
+        return self._to_dict(filtered[-1]) if filtered else self.prior.copy()
+    
+    def reset(self):
+        """Go back to the prior"""
+        self.current_belief = self.prior.copy()
+        self.observations_seen = 0
+        self.log_likelihood = 0.0
+    
+    # ---------- offline ----------
+    def _forward(self, observations):
+        """Scaled forward pass: (filtered vectors, per-step P(evidence))"""
+        filtered = []
+        scales = []
+        vector = self._prior_vector()
+        for t, evidence in enumerate(observations):
+            if t > 0:
+                vector = self._predict_vector(vector)
+            vector, scale = self._update_vector(vector, evidence)
+            if scale == 0:
+                raise ValueError(f"Observation {t} ({evidence!r}) is impossible under this model")
+            filtered.append(vector)
+            scales.append(scale)
+        return filtered, scales
+    
+    def filter(self, observations):
+        """
+        Filtered beliefs for a whole sequence, starting from the prior
+        
+        Returns: (list of belief dicts, log P(observations))
+        """
+        filtered, scales = self._forward(observations)
+        return [self._to_dict(v) for v in filtered], sum(log(c) for c in scales)
+    
+    def filter_batch(self, sequences):
+        """
+        Filter many independent sequences with the same model
+        
+        Returns: list of (final belief dict, log P(sequence)) pairs
+        """
+        results = []
+        for observations in sequences:
+            filtered, scales = self._forward(observations)
+            final = self._to_dict(filtered[-1]) if filtered else self.prior.copy()
+            results.append((final, sum(log(c) for c in scales)))
+        return results
+    
+    def smooth(self, observations):
+        """
+        Forward-backward smoothing: P(state at t | all observations), every t
+        
+        Returns: list of belief dicts, one per observation
+        """
+        filtered, scales = self._forward(observations)
+        n = len(self.states)
+        backward = [1.0] * n
+        smoothed = [None] * len(filtered)
+        
+        for t in range(len(filtered) - 1, -1, -1):
+            combined = [f * b for f, b in zip(filtered[t], backward)]
+            total = sum(combined)
+            smoothed[t] = self._to_dict([p / total for p in combined])
+            if t > 0:
+                weighted = [e * b for e, b in zip(self._emissions(observations[t]), backward)]
+                scale = scales[t]
+                backward = [sum(p_ij * weighted[j] for j, p_ij in self._rows[i]) / scale
+                            for i in range(n)]
+        
+        return smoothed
+    
+    def viterbi(self, observations):
+        """
+        Most likely sequence of states given the observations (in log space)
+        
+        Returns: (list of states, log P(states, observations))
+        """
+        if not observations:
+            return [], 0.0
+        
+        def log_emissions(evidence):
+            return [log(e) if e > 0 else -inf for e in self._emissions(evidence)]
+        
+        n = len(self.states)
+        scores = [(log(p) if p > 0 else -inf) + e
+                  for p, e in zip(self._prior_vector(), log_emissions(observations[0]))]
+        back_pointers = []
+        
+        for evidence in observations[1:]:
+            best = [-inf] * n
+            came_from = [0] * n
+            for i, score in enumerate(scores):
+                if score == -inf:
+                    continue
+                for j, log_p in self._log_rows[i]:
+                    candidate = score + log_p
+                    if candidate > best[j]:
+                        best[j] = candidate
+                        came_from[j] = i
+            scores = [b + e for b, e in zip(best, log_emissions(evidence))]
+            back_pointers.append(came_from)
+        
+        last = max(range(n), key=scores.__getitem__)
+        best_score = scores[last]
+        if best_score == -inf:
+            raise ValueError("The observations are impossible under this model")
+        path = [last]
+        for came_from in reversed(back_pointers):
+            path.append(came_from[path[-1]])
+        path.reverse()
+        return [self.states[i] for i in path], best_score
+
+
+def server_monitoring_example():
+    print("=== SERVER MONITORING - HIDDEN MARKOV FILTER ===")
+    print("A server is Healthy, Degraded or Failed, and can change state between checks.")
+    print("Each check only shows whether an alert fired.")
+    print()
+    
+    prior = {'Healthy': 0.90, 'Degraded': 0.08, 'Failed': 0.02}
+    transition = {
+        'Healthy':  {'Healthy': 0.95, 'Degraded': 0.04, 'Failed': 0.01},
+        'Degraded': {'Healthy': 0.10, 'Degraded': 0.80, 'Failed': 0.10},
+        'Failed':   {'Failed': 1.0},
+    }
+    likelihood = {
+        'Alert':    {'Healthy': 0.05, 'Degraded': 0.60, 'Failed': 0.95},
+        'No Alert': {'Healthy': 0.95, 'Degraded': 0.40, 'Failed': 0.05},
+    }
+    checks = ['No Alert', 'Alert', 'No Alert', 'Alert', 'Alert', 'Alert']
+    
+    monitor = HiddenMarkovFilter(prior, likelihood, transition)
+    print("1. FILTERING (belief after each check):")
+    for check in checks:
+        belief = monitor.observe(check)
+        summary = ", ".join(f"{state} {p:.3f}" for state, p in belief.items())
+        print(f"   {check:8s} -> {summary}")
+    print()
+    
+    print("2. SMOOTHING (belief at each check, using all checks):")
+    for check, belief in zip(checks, monitor.smooth(checks)):
+        print(f"   {check:8s} -> P(Failed) = {belief['Failed']:.3f}")
+    print()
+    
+    path, log_p = monitor.viterbi(checks)
+    print("3. MOST LIKELY STATE SEQUENCE (Viterbi):")
+    print(f"   {' -> '.join(path)}")
+
+
+def main():
+    server_monitoring_example()
+
+
+if __name__ == "__main__":
+    main()
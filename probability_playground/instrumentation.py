@@ -0,0 +1,294 @@
+"""
+Opt-in counters and timers for the simulator and the Bayesian updater.
+
+    from probability_playground import instrumentation
+    
+    probe = instrumentation.enable(instrumentation.JsonlSink('metrics.jsonl'))
+    with instrumentation.experiment('heart-draws'):
+        ...                       # simulate_draws, BayesianUpdater.update, ...
+    probe.flush()                 # one JSON line per flush
+    instrumentation.disable()
+
+Instrumented functions check a module-level hook; while instrumentation is
+disabled that check is the only cost.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from . import bayesian_updating, card_simulations
+
+# Modules that carry a `_probe` hook
+_INSTRUMENTED_MODULES = [card_simulations, bayesian_updating]
+
+_active = None
+_current_experiment = None
+
+
+class Instrumentation:
+    """
+    Counters (how many draws, updates, ...) and per-stage timers.
+    
+    Counters:
+    draws, random_numbers, outcomes_evaluated (card simulation);
+    updates, normalizations, zero_mass_events (Bayesian updating)
+    
+    Timers (count, total and max seconds per call):
+    simulate_draws, experimental_probability, update, update_many
+    """
+    
+    def __init__(self, sink=None):
+        self.sink = sink
+        self.clock = time.perf_counter
+        self.counters = {}
+        self.timers = {}  # name -> [calls, total seconds, max seconds]
+    
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def record(self, name, seconds):
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [1, seconds, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+            if seconds > timer[2]:
+                timer[2] = seconds
+    
+    def snapshot(self):
+        """Current values as a plain dict"""
+        return {
+            'time': time.time(),
+            'experiment': _current_experiment,
+            'counters': dict(self.counters),
+            'timers': {name: {'calls': t[0], 'total_seconds': t[1], 'max_seconds': t[2]}
+                       for name, t in self.timers.items()},
+        }
+    
+    def flush(self, reset=True):
+        """Send a snapshot to the sink (and start counting from zero)"""
+        snapshot = self.snapshot()
+        if self.sink is not None:
+            self.sink.emit(snapshot)
+        if reset:
+            self.reset()
+        return snapshot
+    
+    def reset(self):
+        self.counters = {}
+        self.timers = {}
+
+
+# ==================== SINKS ====================
+class MemorySink:
+    """Keeps every snapshot in a list"""
+    
+    def __init__(self):
+        self.snapshots = []
+    
+    def emit(self, snapshot):
+        self.snapshots.append(snapshot)
+
+
+class JsonlSink:
+    """Appends each snapshot as one JSON line to a file"""
+    
+    def __init__(self, path):
+        self.path = path
+    
+    def emit(self, snapshot):
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(snapshot) + '\n')
+
+
+class PrometheusFileSink:
+    """Overwrites a file with the latest snapshot in Prometheus text format"""
+    
+    def __init__(self, path, prefix='probability_playground'):
+        self.path = path
+        self.prefix = prefix
+    
+    def emit(self, snapshot):
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            f.write(prometheus_text(snapshot, self.prefix))
+        # Readers never see a half-written file
+        os.replace(temp_path, self.path)
+
+
+def prometheus_text(snapshot, prefix='probability_playground'):
+    """Render a snapshot in the Prometheus text exposition format"""
+    label = ''
+    if snapshot.get('experiment') is not None:
+        escaped = str(snapshot['experiment']).replace('\\', '\\\\').replace('"', '\\"')
+        label = f'{{experiment="{escaped}"}}'
+    
+    lines = []
+    for name, value in sorted(snapshot['counters'].items()):
+        metric = f"{prefix}_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric}{label} {value}")
+    for name, timer in sorted(snapshot['timers'].items()):
+        metric = f"{prefix}_{name}_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        lines.append(f"{metric}_count{label} {timer['calls']}")
+        lines.append(f"{metric}_sum{label} {timer['total_seconds']!r}")
+        lines.append(f"# TYPE {metric}_max gauge")
+        lines.append(f"{metric}_max{label} {timer['max_seconds']!r}")
+    return '\n'.join(lines) + '\n'
+
+
+# ==================== SWITCHING ON AND OFF ====================
+def enable(sink=None, instrumentation=None):
+    """Start instrumenting; returns the active Instrumentation"""
+    global _active
+    _active = instrumentation or Instrumentation(sink)
+    for module in _INSTRUMENTED_MODULES:
+        module._probe = _active
+    return _active
+
+
+def disable():
+    """Stop instrumenting; returns the Instrumentation that was active"""
+    global _active
+    previous = _active
+    _active = None
+    for module in _INSTRUMENTED_MODULES:
+        module._probe = None
+    return previous
+
+
+def active():
+    return _active
+
+
+@contextmanager
+def experiment(name):
+    """Tag snapshots and profiler samples taken inside this block with name"""
+    global _current_experiment
+    previous = _current_experiment
+    _current_experiment = name
+    try:
+        yield
+    finally:
+        _current_experiment = previous
+
+
+# ==================== SAMPLING PROFILER ====================
+class StackSampler:
+    """
+    Samples one thread's stack at a fixed interval from a background thread
+    and counts each stack, tagged with the experiment running at the time.
+    
+    folded() returns lines in the "folded stacks" format used by flame
+    graph tools: experiment;outer_function;...;inner_function count
+    """
+    
+    def __init__(self, interval=0.005, thread_id=None, max_depth=64):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.max_depth = max_depth
+        self.samples = {}
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def _sample_once(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+            frame = frame.f_back
+        names.append(_current_experiment or '(no experiment)')
+        key = ';'.join(reversed(names))
+        self.samples[key] = self.samples.get(key, 0) + 1
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample_once()
+    
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='StackSampler', daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+    
+    def folded(self):
+        return [f"{stack} {count}" for stack, count in sorted(self.samples.items())]
+    
+    def by_experiment(self):
+        """Total samples per experiment name"""
+        totals = {}
+        for stack, count in self.samples.items():
+            name = stack.split(';', 1)[0]
+            totals[name] = totals.get(name, 0) + count
+        return totals
+
+
+def instrumentation_example():
+    print("=== INSTRUMENTATION ===")
+    sink = MemorySink()
+    probe = enable(sink)
+    
+    deck = card_simulations.create_deck()
+    prior = {'Disease': 0.02, 'No Disease': 0.98}
+    likelihood = {
+        'Positive': {'Disease': 0.95, 'No Disease': 0.03},
+        'Negative': {'Disease': 0.05, 'No Disease': 0.97},
+    }
+    
+    with StackSampler(interval=0.002) as sampler:
+        with experiment('heart-draws'):
+            for seed in range(20):
+                draws = card_simulations.simulate_draws(
+                    deck, 5000, random_gen=card_simulations.SimpleRandom(seed))
+                card_simulations.experimental_probability(draws, lambda c: c.endswith('H'))
+            probe.flush()
+        
+        with experiment('screening'):
+            for _ in range(2000):
+                doctor = bayesian_updating.BayesianUpdater(prior, likelihood)
+                doctor.update('Positive')
+                doctor.update('Negative')
+                doctor.update('Unknown result')  # not in the likelihood: zero mass
+            probe.flush()
+    disable()
+    
+    for snapshot in sink.snapshots:
+        print(f"Experiment {snapshot['experiment']}:")
+        for name, value in sorted(snapshot['counters'].items()):
+            print(f"   {name:24s} {value:,}")
+        for name, timer in sorted(snapshot['timers'].items()):
+            print(f"   {name:24s} {timer['calls']:,} calls, {timer['total_seconds'] * 1000:.1f} ms total")
+    print()
+    print("Prometheus text for the last snapshot:")
+    print('   ' + prometheus_text(sink.snapshots[-1]).rstrip().replace('\n', '\n   '))
+    print()
+    print(f"Profiler samples per experiment: {sampler.by_experiment()}")
+
+
+def main():
+    instrumentation_example()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+import asyncio
+from collections import deque
+
+from .bayesian_updating import BayesianUpdater
+
+
+class LiveBeliefHub:
+    """
+    Asyncio front-end that keeps one belief state per key up to date.
+    
+    Producers await submit(key, evidence). A single consumer task (run)
+    wakes up when evidence arrives, waits one tick so more can pile up,
+    then applies everything queued for each key with one
+    BayesianUpdater.update_many call. Consumers can await the next
+    posterior for a key (wait_for_update) or subscribe to every change.
+    
+    The input queue is bounded (max_queue), so fast producers wait instead
+    of growing memory without limit. Evidence the updater rejects (e.g.
+    unhashable) fails that key's pending wait_for_update calls with the
+    error and is counted in events_failed; other keys are unaffected.
+    """
+    
+    def __init__(self, prior=None, likelihood=None, updater_factory=None,
+                 max_queue=10000, max_batch=1000, tick=0.005, latency_window=10000):
+        """
+        Parameters:
+        prior, likelihood: model used for every key (as for BayesianUpdater)
+        updater_factory: alternatively, function key -> BayesianUpdater
+        max_queue: most evidence events waiting at once
+        max_batch: most evidence events applied per tick
+        tick: seconds to wait for more evidence before applying a batch
+        latency_window: number of recent latencies kept for metrics()
+        """
+        if updater_factory is None:
+            if prior is None or likelihood is None:
+                raise ValueError("Give either prior and likelihood, or updater_factory")
+            updater_factory = lambda key: BayesianUpdater(prior, likelihood)
+        self.updater_factory = updater_factory
+        self.max_batch = max_batch
+        self.tick = tick
+        
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.updaters = {}
+        self._waiters = {}      # key -> list of futures for the next update
+        self._subscribers = {}  # key -> list of asyncio.Queue
+        self._task = None
+        
+        self.events_processed = 0
+        self.events_failed = 0
+        self.batches_processed = 0
+        self.subscriber_drops = 0
+        self._latencies = deque(maxlen=latency_window)
+    
+    # ---------- producers ----------
+    async def submit(self, key, evidence):
+        """Queue one piece of evidence for key (waits while the queue is full)"""
+        await self.queue.put((key, evidence, asyncio.get_running_loop().time()))
+    
+    def submit_nowait(self, key, evidence):
+        """Queue evidence without waiting; raises asyncio.QueueFull if full"""
+        self.queue.put_nowait((key, evidence, asyncio.get_running_loop().time()))
+    
+    # ---------- consumers ----------
+    def belief(self, key):
+        """Current posterior for key (the prior if nothing was seen yet)"""
+        return self._updater(key).current_belief.copy()
+    
+    async def wait_for_update(self, key):
+        """Wait for the next batch that changes key, and return the posterior"""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, []).append(future)
+        return await future
+    
+    def subscribe(self, key, maxsize=100):
+        """
+        Queue that receives every new posterior for key
+        
+        If a subscriber falls behind and its queue fills up, the oldest
+        posterior is dropped (counted in subscriber_drops).
+        """
+        subscription = asyncio.Queue(maxsize=maxsize)
+        self._subscribers.setdefault(key, []).append(subscription)
+        return subscription
+    
+    def unsubscribe(self, key, subscription):
+        subscribers = self._subscribers.get(key, [])
+        if subscription in subscribers:
+            subscribers.remove(subscription)
+    
+    # ---------- processing ----------
+    def _updater(self, key):
+        updater = self.updaters.get(key)
+        if updater is None:
+            updater = self.updater_factory(key)
+            self.updaters[key] = updater
+        return updater
+    
+    def _apply(self, batch):
+        """Apply one batch of (key, evidence, enqueued_at) events"""
+        by_key = {}
+        for key, evidence, _ in batch:
+            try:
+                by_key.setdefault(key, []).append(evidence)
+            except TypeError:
+                self.events_failed += 1  # unhashable key: nobody can wait on it
+        
+        for key, evidence_list in by_key.items():
+            try:
+                posterior = self._updater(key).update_many(evidence_list)
+            except Exception as error:
+                # A bad event only fails its own key; the consumer keeps going
+                self.events_failed += len(evidence_list)
+                for future in self._waiters.pop(key, []):
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            
+            for future in self._waiters.pop(key, []):
+                if not future.done():
+                    future.set_result(posterior.copy())
+            for subscription in self._subscribers.get(key, []):
+                if subscription.full():
+                    subscription.get_nowait()
+                    self.subscriber_drops += 1
+                subscription.put_nowait(posterior.copy())
+        
+        now = asyncio.get_running_loop().time()
+        self._latencies.extend(now - enqueued_at for _, _, enqueued_at in batch)
+        self.events_processed += len(batch)
+        self.batches_processed += 1
+    
+    async def run(self):
+        """Consume evidence forever (normally started with start())"""
+        while True:
+            batch = [await self.queue.get()]
+            if self.tick:
+                await asyncio.sleep(self.tick)
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                self._apply(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+    
+    def start(self):
+        """Start the consumer task on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+    
+    async def stop(self):
+        """Apply everything still queued, then stop the consumer task"""
+        if self._task is None:
+            return
+        await self.queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    # ---------- monitoring ----------
+    def metrics(self):
+        """Throughput and queue-to-posterior latency (seconds) for monitoring"""
+        latencies = sorted(self._latencies)
+        
+        def percentile(q):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+        
+        return {
+            'events_processed': self.events_processed,
+            'events_failed': self.events_failed,
+            'batches_processed': self.batches_processed,
+            'mean_batch_size': self.events_processed / self.batches_processed if self.batches_processed else 0.0,
+            'queue_size': self.queue.qsize(),
+            'keys': len(self.updaters),
+            'subscriber_drops': self.subscriber_drops,
+            'latency_mean': sum(latencies) / len(latencies) if latencies else 0.0,
+            'latency_p50': percentile(0.50),
+            'latency_p99': percentile(0.99),
+            'latency_max': latencies[-1] if latencies else 0.0,
+        }
+
+
+async def live_screening_example():
+    print("=== LIVE SCREENING - ASYNC BAYESIAN UPDATING ===")
+    print("Two labs stream test results for 3 patients; the hub keeps each patient's belief current.")
+    print()
+    
+    prior = {'Disease': 0.02, 'No Disease': 0.98}
+    likelihood = {
+        'Positive': {'Disease': 0.95, 'No Disease': 0.03},
+        'Negative': {'Disease': 0.05, 'No Disease': 0.97},
+    }
+    hub = LiveBeliefHub(prior, likelihood, max_queue=100)
+    hub.start()
+    
+    watch = hub.subscribe('patient-1')
+    
+    async def lab(results):
+        for patient, result in results:
+            await hub.submit(patient, result)
+            await asyncio.sleep(0.01)
+    
+    await asyncio.gather(
+        lab([('patient-1', 'Positive'), ('patient-2', 'Negative'), ('patient-1', 'Positive')]),
+        lab([('patient-3', 'Negative'), ('patient-1', 'Negative'), ('patient-2', 'Negative')]),
+    )
+    await hub.stop()
+    
+    print("Updates seen by the patient-1 subscriber:")
+    while not watch.empty():
+        print(f"   P(Disease) = {(await watch.get())['Disease']:.4f}")
+    print()
+    
+    print("Final beliefs:")
+    for patient in sorted(hub.updaters):
+        print(f"   {patient}: P(Disease) = {hub.belief(patient)['Disease']:.4f}")
+    print()
+    
+    metrics = hub.metrics()
+    print(f"{metrics['events_processed']} results in {metrics['batches_processed']} batches, "
+          f"p99 latency {metrics['latency_p99'] * 1000:.1f} ms")
+
+
+def main():
+    asyncio.run(live_screening_example())
+
+
+if __name__ == "__main__":
+    main()
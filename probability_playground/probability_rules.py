@@ -0,0 +1,725 @@
+from math import exp, gcd, inf, log
+
+
+# ==================== EXACT ARITHMETIC ====================
+# In exact mode a probability is a (numerator, denominator) pair of ints.
+# Pairs are NOT reduced after every operation: reducing costs a gcd, so we
+# only reduce when the denominator grows past _EXACT_REDUCE_BITS or when
+# the caller asks for it (reduce_exact / reduce_exact_batch).
+_EXACT_REDUCE_BITS = 64
+
+
+def _maybe_reduce(numerator, denominator):
+    """Reduce a pair only once its denominator has grown large"""
+    if denominator.bit_length() > _EXACT_REDUCE_BITS:
+        divisor = gcd(numerator, denominator)
+        return (numerator // divisor, denominator // divisor)
+    return (numerator, denominator)
+
+
+def _exact_add(p, q):
+    """(a/b) + (c/d) without reducing when denominators already match"""
+    if p[1] == q[1]:
+        return _maybe_reduce(p[0] + q[0], p[1])
+    return _maybe_reduce(p[0] * q[1] + q[0] * p[1], p[1] * q[1])
+
+
+def _exact_sub(p, q):
+    """(a/b) - (c/d) without reducing when denominators already match"""
+    if p[1] == q[1]:
+        return _maybe_reduce(p[0] - q[0], p[1])
+    return _maybe_reduce(p[0] * q[1] - q[0] * p[1], p[1] * q[1])
+
+
+def reduce_exact(p):
+    """
+    Reduce an exact probability to lowest terms
+    
+    Parameters:
+    p: (numerator, denominator) pair
+    
+    Returns: Reduced (numerator, denominator) pair
+    """
+    numerator, denominator = p
+    divisor = gcd(numerator, denominator)
+    if divisor == 0:
+        return (0, 1)
+    return (numerator // divisor, denominator // divisor)
+
+
+def reduce_exact_batch(values):
+    """
+    Reduce many exact probabilities in one pass
+    
+    Parameters:
+    values: Iterable of (numerator, denominator) pairs
+    
+    Returns: List of reduced pairs
+    """
+    reduced = []
+    for numerator, denominator in values:
+        divisor = gcd(numerator, denominator) or 1
+        reduced.append((numerator // divisor, denominator // divisor))
+    return reduced
+
+
+def exact_equal(p, q):
+    """Compare two exact probabilities without reducing either one"""
+    return p[0] * q[1] == q[0] * p[1]
+
+
+def exact_to_float(p):
+    """Convert an exact probability to a float (for display)"""
+    if p[1] == 0:
+        return 0.0
+    return p[0] / p[1]
+
+
+# ==================== PROBABILITY RULES ====================
+def addition_rule(pA, pB, pA_and_B, exact=False):
+    """
+    Calculate P(A or B) = P(A) + P(B) - P(A and B)
+    
+    Parameters:
+    pA: Probability of event A
+    pB: Probability of event B
+    pA_and_B: Probability of both A and B occurring
+    exact: If True, all probabilities are (numerator, denominator) pairs
+    
+    Returns: Probability of A or B occurring
+    """
+    if exact:
+        return _exact_sub(_exact_add(pA, pB), pA_and_B)
+    return pA + pB - pA_and_B
+
+
+def multiplication_rule(pA, pB, are_independent, pB_given_A=None, exact=False):
+    """
+    Calculate P(A and B)
+    
+    If independent: P(A and B) = P(A) * P(B)
+    If dependent: P(A and B) = P(A) * P(B|A)
+    
+    Parameters:
+    pA: Probability of event A
+    pB: Probability of event B
+    are_independent: Boolean, True if events are independent
+    pB_given_A: P(B|A) - only needed when are_independent=False
+    exact: If True, all probabilities are (numerator, denominator) pairs
+    
+    Returns: Probability of both A and B occurring
+    """
+    if are_independent:
+        second = pB
+    else:
+        # For dependent events, we need P(B|A)
+        # pB parameter is not used for dependent case
+        if pB_given_A is None:
+            raise ValueError("For dependent events, pB_given_A is required")
+        second = pB_given_A
+    
+    if exact:
+        return _maybe_reduce(pA[0] * second[0], pA[1] * second[1])
+    return pA * second
+
+
+def complement_rule(pA, exact=False):
+    """
+    Calculate P(not A) = 1 - P(A)
+    
+    Parameters:
+    pA: Probability of event A
+    exact: If True, pA is a (numerator, denominator) pair
+    
+    Returns: Probability of event not A occurring
+    """
+    if exact:
+        return (pA[1] - pA[0], pA[1])
+    return 1 - pA
+
+
+# Helper function
+def calculate_probability(favorable, total, exact=False):
+    """Calculate basic probability (as a (favorable, total) pair if exact)"""
+    if total == 0:
+        return (0, 1) if exact else 0.0
+    if exact:
+        return (favorable, total)
+    return favorable / total
+
+
+# ==================== BATCH RULES ====================
+# Batch versions take equal-length sequences (lists, tuples, array('d'))
+# and evaluate the rule for every index in a single comprehension, so the
+# per-call overhead of the scalar functions is paid once per batch.
+_MAX_REPORTED_INDICES = 10
+
+
+def check_probability_batch(pA, pB=None, pA_and_B=None, tolerance=1e-12):
+    """
+    Find entries that cannot be valid probabilities
+    
+    Checks 0 <= p <= 1 for every value given, and when the joint
+    probability is given, the Frechet bounds
+    max(0, P(A) + P(B) - 1) <= P(A and B) <= min(P(A), P(B))
+    
+    Parameters:
+    pA: Sequence of P(A) values
+    pB: Sequence of P(B) values (optional)
+    pA_and_B: Sequence of P(A and B) values (optional, needs pB)
+    tolerance: Allowable floating point slack on the Frechet bounds
+    
+    Returns: Dict with 'out_of_bounds' and 'frechet' lists of offending indices
+    """
+    columns = [pA] + [c for c in (pB, pA_and_B) if c is not None]
+    size = len(pA)
+    for column in columns:
+        if len(column) != size:
+            raise ValueError("All probability sequences must have the same length")
+    
+    out_of_bounds = set()
+    for column in columns:
+        out_of_bounds.update(i for i, p in enumerate(column) if not 0 <= p <= 1)
+    
+    frechet = []
+    if pB is not None and pA_and_B is not None:
+        frechet = [i for i, (a, b, ab) in enumerate(zip(pA, pB, pA_and_B))
+                   if ab > min(a, b) + tolerance or ab < a + b - 1 - tolerance]
+    
+    return {'out_of_bounds': sorted(out_of_bounds), 'frechet': frechet}
+
+
+def _raise_if_invalid(problems):
+    """Raise ValueError naming the first offending indices, if any"""
+    for kind, indices in problems.items():
+        if indices:
+            shown = indices[:_MAX_REPORTED_INDICES]
+            more = "" if len(indices) <= len(shown) else f" (and {len(indices) - len(shown)} more)"
+            raise ValueError(f"Invalid probabilities ({kind}) at indices {shown}{more}")
+
+
+def addition_rule_batch(pA, pB, pA_and_B, validate=True):
+    """
+    Calculate P(A or B) = P(A) + P(B) - P(A and B) for every index
+    
+    Parameters:
+    pA, pB, pA_and_B: Equal-length sequences of probabilities
+    validate: If True, raise ValueError listing invalid indices
+    
+    Returns: List of P(A or B) values
+    """
+    if validate:
+        _raise_if_invalid(check_probability_batch(pA, pB, pA_and_B))
+    return [a + b - ab for a, b, ab in zip(pA, pB, pA_and_B)]
+
+
+def multiplication_rule_batch(pA, pB, are_independent, pB_given_A=None, validate=True):
+    """
+    Calculate P(A and B) for every index
+    
+    Parameters:
+    pA, pB: Equal-length sequences of probabilities
+    are_independent: Boolean, True if events are independent
+    pB_given_A: Sequence of P(B|A) - only needed when are_independent=False
+    validate: If True, raise ValueError listing invalid indices
+    
+    Returns: List of P(A and B) values
+    """
+    if are_independent:
+        second = pB
+    else:
+        if pB_given_A is None:
+            raise ValueError("For dependent events, pB_given_A is required")
+        second = pB_given_A
+    
+    if validate:
+        _raise_if_invalid(check_probability_batch(pA, second))
+    return [a * b for a, b in zip(pA, second)]
+
+
+def complement_rule_batch(pA, validate=True):
+    """
+    Calculate P(not A) = 1 - P(A) for every index
+    
+    Parameters:
+    pA: Sequence of probabilities
+    validate: If True, raise ValueError listing invalid indices
+    
+    Returns: List of P(not A) values
+    """
+    if validate:
+        _raise_if_invalid(check_probability_batch(pA))
+    return [1 - a for a in pA]
+
+
+# ==================== UNION OF MANY EVENTS ====================
+def index_sample_space(sample_space):
+    """
+    Give every outcome in the sample space its own bit position
+    
+    Parameters:
+    sample_space: List of all possible outcomes
+    
+    Returns: Dict mapping outcome -> bit position
+    """
+    return {outcome: position for position, outcome in enumerate(sample_space)}
+
+
+def event_bitmask(event, index):
+    """
+    Encode an event as an integer bitset over an indexed sample space
+    
+    Parameters:
+    event: List of outcomes in the event
+    index: Dict from index_sample_space
+    
+    Returns: Integer with one bit set per outcome in the event
+    """
+    mask = 0
+    for outcome in event:
+        mask |= 1 << index[outcome]
+    return mask
+
+
+def union_probability_from_outcomes(events, sample_space):
+    """
+    Calculate P(A1 or A2 or ... or An) when outcomes are equally likely
+    
+    Each event becomes a bitset, the union is a bitwise OR, and the
+    probability is the number of set bits over the sample space size.
+    
+    Parameters:
+    events: List of events (each a list of outcomes)
+    sample_space: List of all possible outcomes
+    
+    Returns: Probability that at least one event occurs
+    """
+    if len(sample_space) == 0:
+        return 0.0
+    index = index_sample_space(sample_space)
+    union = 0
+    for event in events:
+        union |= event_bitmask(event, index)
+    return union.bit_count() / len(sample_space)
+
+
+def _intersection_terms(num_events, joint_probability, max_size=None):
+    """
+    Yield (size, probability) for every non-zero intersection
+    
+    Subsets are grown one event at a time in increasing index order. An
+    intersection with probability 0 makes every superset 0 too, so its
+    whole branch is skipped.
+    """
+    stack = []
+    for i in range(num_events):
+        p = joint_probability.get((i,), 0)
+        if p != 0:
+            stack.append(((i,), p))
+    
+    while stack:
+        subset, p = stack.pop()
+        yield len(subset), p
+        if max_size is not None and len(subset) >= max_size:
+            continue
+        for j in range(subset[-1] + 1, num_events):
+            key = subset + (j,)
+            p_next = joint_probability.get(key, 0)
+            if p_next != 0:
+                stack.append((key, p_next))
+
+
+def union_probability(num_events, joint_probability):
+    """
+    Calculate P(A1 or ... or An) by inclusion-exclusion
+    
+    P(union) = sum P(Ai) - sum P(Ai and Aj) + sum P(Ai and Aj and Ak) - ...
+    
+    Parameters:
+    num_events: Number of events n (events are numbered 0 .. n-1)
+    joint_probability: Dict mapping a sorted tuple of event numbers to the
+        probability that all of those events occur, e.g. {(0,): 0.5,
+        (1,): 0.4, (0, 1): 0.1}. Missing tuples are taken to be 0.
+    
+    Returns: Probability that at least one event occurs
+    """
+    total = 0.0
+    for size, p in _intersection_terms(num_events, joint_probability):
+        if size % 2 == 1:
+            total += p
+        else:
+            total -= p
+    return total
+
+
+def bonferroni_bounds(num_events, joint_probability, order=2):
+    """
+    Cheap lower and upper bounds on P(A1 or ... or An)
+    
+    Truncating inclusion-exclusion after an odd number of sums gives an
+    upper bound, after an even number a lower bound. Only intersections of
+    up to `order` events are looked at.
+    
+    Parameters:
+    num_events: Number of events n
+    joint_probability: Same dict format as union_probability
+    order: Largest intersection size to use (1 = Boole's inequality)
+    
+    Returns: (lower, upper) bounds
+    """
+    if order < 1:
+        raise ValueError("order must be at least 1")
+    
+    sums = [0.0] * (order + 1)
+    for size, p in _intersection_terms(num_events, joint_probability, max_size=order):
+        sums[size] += p
+    
+    singles = [joint_probability.get((i,), 0) for i in range(num_events)]
+    lower = max(singles, default=0.0)
+    upper = min(1.0, sums[1])
+    
+    partial = 0.0
+    for k in range(1, order + 1):
+        partial += sums[k] if k % 2 == 1 else -sums[k]
+        if k % 2 == 1:
+            upper = min(upper, partial)
+        else:
+            lower = max(lower, partial)
+    
+    return lower, upper
+
+
+# ==================== CHAIN RULE ====================
+class ChainRuleEvaluator:
+    """
+    P(A1 and A2 and ... and An) = P(A1) * P(A2|A1) * ... * P(An|A1..An-1)
+    
+    Prefix results are cached in a trie, so sequences that start the same
+    way (e.g. every draw order in a card game tree) only compute the shared
+    part once. Products are kept as sums of logs so long chains don't
+    underflow to 0.
+    """
+    
+    def __init__(self, conditional):
+        """
+        Parameters:
+        conditional: Function (prefix, event) -> P(event | prefix), where
+            prefix is the tuple of events that already happened
+        """
+        self.conditional = conditional
+        self.root = {}  # event -> [log P(prefix + event), children]
+        self.hits = 0
+        self.misses = 0
+    
+    def log_probability(self, sequence):
+        """Return log P(sequence), or -inf if the sequence is impossible"""
+        sequence = tuple(sequence)
+        children = self.root
+        log_p = 0.0
+        
+        for depth, event in enumerate(sequence):
+            node = children.get(event)
+            if node is None:
+                self.misses += 1
+                if log_p != -inf:
+                    p = self.conditional(sequence[:depth], event)
+                    log_p = log_p + log(p) if p > 0 else -inf
+                node = [log_p, {}]
+                children[event] = node
+            else:
+                self.hits += 1
+            log_p = node[0]
+            children = node[1]
+        
+        return log_p
+    
+    def probability(self, sequence):
+        """Return P(sequence) using the cached prefix products"""
+        return exp(self.log_probability(sequence))
+    
+    def probabilities(self, sequences):
+        """Return P(sequence) for every sequence in a list"""
+        return [self.probability(sequence) for sequence in sequences]
+    
+    def clear(self):
+        """Forget all cached prefixes"""
+        self.root = {}
+        self.hits = 0
+        self.misses = 0
+
+
+# ==================== SURVEY CROSS-TABS ====================
+_BIT_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+
+def _pack_bits(values):
+    """Pack a sequence of yes/no answers into one integer (bit r = answer r)"""
+    if len(values) == 0:
+        return 0
+    # One 0/1 byte per answer, reversed so answer 0 is the lowest bit,
+    # then parsed as a base-2 number in a single pass
+    digits = bytes(map(bool, values))[::-1].translate(_BIT_DIGITS)
+    return int(digits, 2)
+
+
+class SurveyCrossTab:
+    """
+    All marginal, pairwise and conditional probabilities for a yes/no survey
+    
+    Each attribute's answers are packed into one integer bitset over the
+    respondents, so "likes both" is a bitwise AND and counting is a
+    popcount (int.bit_count) instead of a loop over respondents.
+    """
+    
+    def __init__(self, attributes, bitsets, num_respondents):
+        """
+        Parameters:
+        attributes: List of attribute names (e.g. ['Math', 'Science'])
+        bitsets: One packed integer per attribute (bit r set = respondent r said yes)
+        num_respondents: Number of respondents
+        """
+        if len(attributes) != len(bitsets):
+            raise ValueError("Need exactly one bitset per attribute")
+        self.attributes = list(attributes)
+        self.bitsets = list(bitsets)
+        self.num_respondents = num_respondents
+        self._joint_counts = None
+    
+    @classmethod
+    def from_columns(cls, attributes, columns):
+        """Build from one list of True/False answers per attribute"""
+        num_respondents = len(columns[0]) if columns else 0
+        for column in columns:
+            if len(column) != num_respondents:
+                raise ValueError("All attribute columns must have the same length")
+        return cls(attributes, [_pack_bits(column) for column in columns], num_respondents)
+    
+    @classmethod
+    def from_rows(cls, attributes, rows):
+        """Build from one list of True/False answers per respondent"""
+        columns = [[] for _ in attributes]
+        for row in rows:
+            for column, value in zip(columns, row):
+                column.append(value)
+        return cls.from_columns(attributes, columns)
+    
+    def counts(self):
+        """Number of respondents answering yes to each attribute"""
+        return [bits.bit_count() for bits in self.bitsets]
+    
+    def joint_counts(self):
+        """Matrix of respondents answering yes to both attribute i and j"""
+        if self._joint_counts is None:
+            size = len(self.bitsets)
+            matrix = [[0] * size for _ in range(size)]
+            for i in range(size):
+                bits_i = self.bitsets[i]
+                matrix[i][i] = bits_i.bit_count()
+                for j in range(i + 1, size):
+                    both = (bits_i & self.bitsets[j]).bit_count()
+                    matrix[i][j] = both
+                    matrix[j][i] = both
+            self._joint_counts = matrix
+        return self._joint_counts
+    
+    def _scale(self, matrix):
+        total = self.num_respondents
+        return [[calculate_probability(count, total) for count in row] for row in matrix]
+    
+    def marginals(self):
+        """P(attribute) for each attribute"""
+        return [calculate_probability(count, self.num_respondents) for count in self.counts()]
+    
+    def joint_matrix(self):
+        """Matrix of P(i AND j)"""
+        return self._scale(self.joint_counts())
+    
+    def union_matrix(self):
+        """Matrix of P(i OR j), by the addition rule on counts"""
+        joint = self.joint_counts()
+        counts = self.counts()
+        return self._scale([[counts[i] + counts[j] - joint[i][j] for j in range(len(counts))]
+                            for i in range(len(counts))])
+    
+    def neither_matrix(self):
+        """Matrix of P(neither i nor j), by the complement rule"""
+        return [[complement_rule(p) for p in row] for row in self.union_matrix()]
+    
+    def conditional_matrix(self):
+        """Matrix of P(j | i) = P(i AND j) / P(i), 0 where P(i) = 0"""
+        joint = self.joint_counts()
+        return [[calculate_probability(joint[i][j], joint[i][i]) for j in range(len(joint))]
+                for i in range(len(joint))]
+    
+    def write_matrix_csv(self, path, matrix):
+        """Write a matrix to CSV with attribute names as row and column labels"""
+        with open(path, 'w') as f:
+            f.write(',' + ','.join(self.attributes) + '\n')
+            for name, row in zip(self.attributes, matrix):
+                f.write(name + ',' + ','.join(repr(value) for value in row) + '\n')
+
+
+def main():
+    # Application Problem Solution
+    print("=== CLASS SURVEY PROBLEM ===")
+    print("Class: 60 students")
+    print("- 30 like Math")
+    print("- 25 like Science")
+    print("- 10 like both")
+    print()
+
+    total_students = 60
+    like_math = 30
+    like_science = 25
+    like_both = 10
+
+    # Calculate probabilities
+    p_math = calculate_probability(like_math, total_students)
+    p_science = calculate_probability(like_science, total_students)
+    p_both = calculate_probability(like_both, total_students)
+    p_science_given_math = calculate_probability(like_both, like_math)
+
+    print("Basic Probabilities:")
+    print(f"P(Math) = {like_math}/{total_students} = {p_math:.4f}")
+    print(f"P(Science) = {like_science}/{total_students} = {p_science:.4f}")
+    print(f"P(Math AND Science) = {like_both}/{total_students} = {p_both:.4f}")
+    print(f"P(Science|Math) = {like_both}/{like_math} = {p_science_given_math:.4f}")
+    print()
+
+    # 1. Probability a student likes Math OR Science
+    print("1. Probability a student likes Math OR Science:")
+    print("   Using Addition Rule: P(Math OR Science) = P(Math) + P(Science) - P(Math AND Science)")
+    result1 = addition_rule(p_math, p_science, p_both)
+    print(f"   = {p_math:.4f} + {p_science:.4f} - {p_both:.4f}")
+    print(f"   = {result1:.4f}")
+    print(f"   Interpretation: {result1*100:.1f}% of students like Math or Science")
+    print()
+
+    # 2. Probability a student likes neither
+    print("2. Probability a student likes neither Math nor Science:")
+    print("   Step 1: Find P(Math OR Science) from above = {result1:.4f}")
+    print("   Step 2: Using Complement Rule: P(neither) = 1 - P(Math OR Science)")
+    result2 = complement_rule(result1)
+    print(f"   = 1 - {result1:.4f}")
+    print(f"   = {result2:.4f}")
+    print(f"   Interpretation: {result2*100:.1f}% of students like neither subject")
+    print()
+
+    # 3. Probability a Math-liker also likes Science (P(Science|Math))
+    print("3. Probability a randomly selected Math-liker also likes Science:")
+    print("   This is conditional probability: P(Science | Math)")
+    print("   Formula: P(Science AND Math) / P(Math)")
+    print(f"   = {p_both:.4f} / {p_math:.4f}")
+    print(f"   = {p_science_given_math:.4f}")
+    print(f"   Interpretation: {p_science_given_math*100:.1f}% of Math-likers also like Science")
+    print()
+
+    # Same answers from the raw survey responses: 10 both, 20 Math only,
+    # 15 Science only, 15 neither
+    survey = SurveyCrossTab.from_rows(
+        ['Math', 'Science'],
+        [(True, True)] * 10 + [(True, False)] * 20 + [(False, True)] * 15 + [(False, False)] * 15)
+    print("Cross-tab from raw responses:")
+    print(f"   P(Math OR Science) = {survey.union_matrix()[0][1]:.4f}")
+    print(f"   P(neither) = {survey.neither_matrix()[0][1]:.4f}")
+    print(f"   P(Science | Math) = {survey.conditional_matrix()[0][1]:.4f}")
+    print()
+
+    # Additional demonstration using multiplication rule
+    print("=== DEMONSTRATING MULTIPLICATION RULE ===")
+    print()
+
+    # Are Math and Science preferences independent?
+    print("Are Math and Science preferences independent?")
+    print("Check: P(Math AND Science) = P(Math) * P(Science)?")
+    expected_if_independent = p_math * p_science
+    print(f"P(Math) * P(Science) = {p_math:.4f} * {p_science:.4f} = {expected_if_independent:.4f}")
+    print(f"Actual P(Math AND Science) = {p_both:.4f}")
+    are_independent = abs(p_both - expected_if_independent) < 0.001
+    print(f"Result: {'Independent' if are_independent else 'Dependent'}")
+    print()
+
+    # Same check in exact mode: no tolerance needed, so no rounding surprises
+    print("Exact check (integer numerator/denominator pairs):")
+    exact_math = calculate_probability(like_math, total_students, exact=True)
+    exact_science = calculate_probability(like_science, total_students, exact=True)
+    exact_both = calculate_probability(like_both, total_students, exact=True)
+    exact_expected = multiplication_rule(exact_math, exact_science, are_independent=True, exact=True)
+    print(f"P(Math) * P(Science) = {reduce_exact(exact_expected)}")
+    print(f"Actual P(Math AND Science) = {reduce_exact(exact_both)}")
+    print(f"Result: {'Independent' if exact_equal(exact_both, exact_expected) else 'Dependent'}")
+    exact_union = addition_rule(exact_math, exact_science, exact_both, exact=True)
+    exact_neither = complement_rule(exact_union, exact=True)
+    print(f"P(Math OR Science) = {reduce_exact(exact_union)}, P(neither) = {reduce_exact(exact_neither)}")
+    print()
+
+    # Using multiplication rule for independent case (hypothetical)
+    print("If they were independent:")
+    print("P(Math AND Science) using multiplication rule:")
+    result_ind = multiplication_rule(p_math, p_science, are_independent=True)
+    print(f"  = P(Math) * P(Science) = {result_ind:.4f}")
+    print()
+
+    # Using multiplication rule for dependent case (actual)
+    print("Since they are actually dependent:")
+    print("P(Math AND Science) = P(Math) * P(Science|Math)")
+    # CORRECT: Pass pB_given_A parameter for dependent case
+    result_dep = multiplication_rule(p_math, None, are_independent=False, pB_given_A=p_science_given_math)
+    print(f"  = {p_math:.4f} * {p_science_given_math:.4f} = {result_dep:.4f}")
+    print(f"  This matches P(Math AND Science) = {p_both:.4f}")
+    print()
+
+    # Simple example of using all rules together
+    print("=== SIMPLE EXAMPLE ===")
+    print("Example: Rolling a fair 6-sided die")
+    print("Event A: Getting an even number (2, 4, 6)")
+    print("Event B: Getting a number greater than 4 (5, 6)")
+    print()
+
+    p_even = 3/6  # P(A)
+    p_gt4 = 2/6   # P(B)
+    p_even_and_gt4 = 1/6  # Only 6 is both even and >4
+
+    # Addition rule
+    p_even_or_gt4 = addition_rule(p_even, p_gt4, p_even_and_gt4)
+    print(f"P(even OR >4) = {p_even:.3f} + {p_gt4:.3f} - {p_even_and_gt4:.3f} = {p_even_or_gt4:.3f}")
+
+    # Check if independent
+    expected = p_even * p_gt4
+    is_independent = abs(p_even_and_gt4 - expected) < 0.001
+    print(f"Are they independent? P(A and B)={p_even_and_gt4:.3f}, P(A)*P(B)={expected:.3f}")
+    print(f"Result: {'Independent' if is_independent else 'Dependent'}")
+
+    # Multiplication rule for independent events
+    if is_independent:
+        p_and = multiplication_rule(p_even, p_gt4, are_independent=True)
+        print(f"Using multiplication rule: {p_even:.3f} * {p_gt4:.3f} = {p_and:.3f}")
+
+    # Complement rule
+    p_not_even = complement_rule(p_even)
+    print(f"P(not even) = 1 - {p_even:.3f} = {p_not_even:.3f}")
+
+    # Union of more than two events
+    die = [1, 2, 3, 4, 5, 6]
+    die_events = [[2, 4, 6], [5, 6], [1, 2]]  # even, >4, <3
+    print(f"P(even OR >4 OR <3) by bitset union = {union_probability_from_outcomes(die_events, die):.3f}")
+    die_joint = {(0,): 3/6, (1,): 2/6, (2,): 2/6, (0, 1): 1/6, (0, 2): 1/6}  # (1, 2) never happens
+    print(f"P(even OR >4 OR <3) by inclusion-exclusion = {union_probability(3, die_joint):.3f}")
+    lower, upper = bonferroni_bounds(3, die_joint, order=1)
+    print(f"Bonferroni bounds (order 1): {lower:.3f} <= P(union) <= {upper:.3f}")
+
+    # Chain rule for drawing suits without replacement
+    def suit_draw_conditional(prefix, suit):
+        """P(next card has this suit | suits already drawn) from a 52-card deck"""
+        return (13 - prefix.count(suit)) / (52 - len(prefix))
+
+    chain = ChainRuleEvaluator(suit_draw_conditional)
+    print(f"P(Heart then Heart) by chain rule = {chain.probability(['H', 'H']):.4f}")
+    all_orders = [[a, b, c] for a in 'HDCS' for b in 'HDCS' for c in 'HDCS']
+    total_p = sum(chain.probabilities(all_orders))
+    print(f"Sum over all {len(all_orders)} three-draw suit orders = {total_p:.4f} "
+          f"({chain.misses} conditionals computed, {chain.hits} reused)")
+
+
+if __name__ == "__main__":
+    main()
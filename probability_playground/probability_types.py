@@ -57,20 +57,25 @@ class ProbabilityCalculator:
         return "Unknown"
 
 
-# Test code exactly as specified
-# Create calculator
-calc = ProbabilityCalculator()
+def main():
+    # Test code exactly as specified
+    # Create calculator
+    calc = ProbabilityCalculator()
 
-# Classical example
-dice_sample = [1, 2, 3, 4, 5, 6]
-even_event = [2, 4, 6]
-print(calc.classical_probability(even_event, dice_sample))  # Should be 0.5
+    # Classical example
+    dice_sample = [1, 2, 3, 4, 5, 6]
+    even_event = [2, 4, 6]
+    print(calc.classical_probability(even_event, dice_sample))  # Should be 0.5
 
-# Empirical example
-weather_data = {'Sunny': 280, 'Rainy': 70, 'Cloudy': 15}
-print(calc.empirical_probability(weather_data))
+    # Empirical example
+    weather_data = {'Sunny': 280, 'Rainy': 70, 'Cloudy': 15}
+    print(calc.empirical_probability(weather_data))
 
-# Identification
-print(calc.identify_probability_type("Based on 1000 coin toss observations"))  # Empirical
-print(calc.identify_probability_type("All cards equally likely to be drawn"))   # Classical
-print(calc.identify_probability_type("I feel it might rain today"))             # Subjective
\ No newline at end of file
+    # Identification
+    print(calc.identify_probability_type("Based on 1000 coin toss observations"))  # Empirical
+    print(calc.identify_probability_type("All cards equally likely to be drawn"))   # Classical
+    print(calc.identify_probability_type("I feel it might rain today"))             # Subjective
+
+
+if __name__ == "__main__":
+    main()
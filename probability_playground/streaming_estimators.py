@@ -0,0 +1,229 @@
+import time
+from math import exp, log
+
+from .card_simulations import SimpleRandom
+
+
+class SlidingWindowEstimator:
+    """
+    Empirical probabilities over the last window_size observations.
+    
+    Observations live in a fixed-size ring buffer next to a count per
+    outcome, so adding one (and forgetting the oldest) and asking for a
+    probability are both O(1).
+    """
+    
+    def __init__(self, window_size):
+        if window_size < 1:
+            raise ValueError("window_size must be at least 1")
+        self.window_size = window_size
+        self.buffer = [None] * window_size
+        self.position = 0
+        self.total = 0
+        self.counts = {}
+    
+    def add(self, outcome):
+        counts = self.counts
+        if self.total == self.window_size:
+            oldest = self.buffer[self.position]
+            if counts[oldest] == 1:
+                del counts[oldest]
+            else:
+                counts[oldest] -= 1
+        else:
+            self.total += 1
+        self.buffer[self.position] = outcome
+        self.position = (self.position + 1) % self.window_size
+        counts[outcome] = counts.get(outcome, 0) + 1
+    
+    def probability(self, outcome):
+        """P(outcome) over the window (0.0 while empty)"""
+        if self.total == 0:
+            return 0.0
+        return self.counts.get(outcome, 0) / self.total
+    
+    def probabilities(self):
+        """Same result as empirical_probability on the window's counts"""
+        if self.total == 0:
+            return {}
+        return {outcome: count / self.total for outcome, count in self.counts.items()}
+
+
+class TimeWindowEstimator:
+    """
+    Empirical probabilities over the last `window` seconds.
+    
+    Time is cut into num_buckets buckets, each with its own counts; when a
+    bucket falls out of the window its counts are subtracted as a whole.
+    The window therefore moves in steps of window / num_buckets, and each
+    observation is added once and removed once (amortized O(1)).
+    """
+    
+    def __init__(self, window, num_buckets=60, clock=time.monotonic):
+        """
+        Parameters:
+        window: length of the window in seconds (in clock units)
+        num_buckets: resolution of the window
+        clock: function returning the current time
+        """
+        if window <= 0 or num_buckets < 1:
+            raise ValueError("window must be positive and num_buckets at least 1")
+        self.bucket_width = window / num_buckets
+        self.clock = clock
+        self.buckets = [{} for _ in range(num_buckets)]
+        self.current = int(clock() // self.bucket_width)
+        self.total = 0
+        self.counts = {}
+    
+    def _advance(self):
+        now = int(self.clock() // self.bucket_width)
+        steps = min(now - self.current, len(self.buckets))
+        for step in range(1, steps + 1):
+            bucket = self.buckets[(self.current + step) % len(self.buckets)]
+            for outcome, count in bucket.items():
+                remaining = self.counts[outcome] - count
+                if remaining:
+                    self.counts[outcome] = remaining
+                else:
+                    del self.counts[outcome]
+                self.total -= count
+            bucket.clear()
+        if now > self.current:
+            self.current = now
+    
+    def add(self, outcome):
+        self._advance()
+        bucket = self.buckets[self.current % len(self.buckets)]
+        bucket[outcome] = bucket.get(outcome, 0) + 1
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+        self.total += 1
+    
+    def probability(self, outcome):
+        self._advance()
+        if self.total == 0:
+            return 0.0
+        return self.counts.get(outcome, 0) / self.total
+    
+    def probabilities(self):
+        self._advance()
+        if self.total == 0:
+            return {}
+        return {outcome: count / self.total for outcome, count in self.counts.items()}
+
+
+class DecayedEstimator:
+    """
+    Empirical probabilities where an observation's weight halves every
+    half_life ticks (by default one tick per observation).
+    
+    Instead of shrinking every count on every tick, new observations are
+    added with a weight that grows by 1 / decay per tick. Probabilities
+    are ratios, so they come out the same. Only when that weight gets
+    huge are all counts rescaled at once, which happens once every few
+    thousand half-lives.
+    """
+    
+    RESCALE_AT = 1e150
+    LOG_RESCALE_AT = log(RESCALE_AT)
+    
+    def __init__(self, half_life):
+        """
+        Parameters:
+        half_life: number of ticks after which an observation counts half
+        """
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+        self.decay = 0.5 ** (1 / half_life)
+        self.log_growth = log(2) / half_life  # log(1 / decay), per tick
+        self.weight = 1.0
+        self.total = 0.0
+        self.counts = {}
+        self.rescales = 0
+    
+    def advance(self, ticks=1):
+        """
+        Let time pass without observations
+        
+        Works in log space, so long idle gaps can't underflow. If the gap
+        is long enough for everything seen so far to decay below 1e-150
+        of a new observation, the counts are simply cleared.
+        """
+        growth = ticks * self.log_growth
+        if growth + log(self.weight) > self.LOG_RESCALE_AT:
+            self._rescale()
+            if growth > self.LOG_RESCALE_AT:
+                self.counts.clear()
+                self.total = 0.0
+                return
+        self.weight *= exp(growth)
+    
+    def _rescale(self):
+        """Bring the weights back to ~1 and forget outcomes that decayed away"""
+        scale = self.weight
+        self.counts = {outcome: count / scale for outcome, count in self.counts.items()
+                       if count / scale > 1e-12}
+        self.total = sum(self.counts.values())
+        self.weight = 1.0
+        self.rescales += 1
+    
+    def add(self, outcome, advance=True):
+        """
+        Record one observation
+        
+        Parameters:
+        advance: move one tick forward first (set False to add several
+            observations at the same time)
+        """
+        if advance:
+            self.advance()
+        self.counts[outcome] = self.counts.get(outcome, 0.0) + self.weight
+        self.total += self.weight
+    
+    def effective_count(self):
+        """Sum of the current (decayed) weights of all observations"""
+        return self.total / self.weight
+    
+    def probability(self, outcome):
+        if self.total == 0:
+            return 0.0
+        return self.counts.get(outcome, 0.0) / self.total
+    
+    def probabilities(self):
+        if self.total == 0:
+            return {}
+        return {outcome: count / self.total for outcome, count in self.counts.items()}
+
+
+def drifting_die_example():
+    print("=== ESTIMATING A DRIFTING DIE ===")
+    print("Fair for 5,000 rolls, then a six comes up two times in three.")
+    print()
+    
+    random_gen = SimpleRandom(seed=3)
+    window = SlidingWindowEstimator(500)
+    decayed = DecayedEstimator(half_life=200)
+    all_time = {}
+    
+    print("  rolls   all-time P(6)   last 500 P(6)   decayed P(6)")
+    for roll_number in range(1, 8001):
+        if roll_number <= 5000 or random_gen.random() < 0.4:
+            face = random_gen.randint(1, 6)
+        else:
+            face = 6
+        window.add(face)
+        decayed.add(face)
+        all_time[face] = all_time.get(face, 0) + 1
+        if roll_number % 1000 == 0:
+            print(f"  {roll_number:5d}   {all_time.get(6, 0) / roll_number:13.3f}   "
+                  f"{window.probability(6):13.3f}   {decayed.probability(6):12.3f}")
+    print()
+    print("The all-time estimate lags behind; the window and the decayed")
+    print("counts follow the change within a few hundred rolls.")
+
+
+def main():
+    drifting_die_example()
+
+
+if __name__ == "__main__":
+    main()